@@ -1,6 +1,6 @@
-from typing import Optional, List, Dict, Union
-import matplotlib.pyplot as plt
+from typing import Optional, List, Dict, Tuple, Union
 import numpy as np
+import numpy_financial as npf
 
 from src.investors.Israel.real_estate_investment_type import RealEstateInvestmentType
 from src.investors.real_estate_investor import RealEstateInvestor
@@ -9,6 +9,7 @@ from src.mortgage.mortgage_pipeline import MortgagePipeline
 from src.mortgage.mortgage_tracks.constant_not_linked import ConstantNotLinked
 from src.mortgage.mortgage_tracks.mortgage_track import MortgageTrack
 from src.business_models.real_estate_property import RealEstateProperty
+from src.business_models.single_house_model import memoize_method
 from src.business_models.Israel.single_house_israel_model import SingleHouseIsraelModel
 
 
@@ -63,8 +64,36 @@ class SingleFromConstructorIL(SingleHouseIsraelModel):
         )
 
         self.years_until_key_reception = years_until_key_reception
+        # Shared pre-key padding; years_until_key_reception is fixed after construction
+        # (years_to_exit is not, so paddings depending on it stay per-call).
+        self._zeros_until_key = [0] * years_until_key_reception
         self.contractor_payment_distribution = contractor_payment_distribution
         self.construction_input_index_annual_growth = construction_input_index_annual_growth
+        # Memoized compensation results, keyed by the inputs the formula depends on. The key is
+        # needed (rather than a plain cached value) because the IRR plot mutates
+        # construction_input_index_annual_growth between calls.
+        self._compensation_cache = {}
+
+    @property
+    def equity_required_by_percentage(self) -> float:
+        return self._equity_required_by_percentage
+
+    @equity_required_by_percentage.setter
+    def equity_required_by_percentage(self, value: float) -> None:
+        # Same percent-or-fraction normalization as the base model; the
+        # compensation formulas read the percent form and the equity payments
+        # the fraction form, so both are kept consistent here.
+        self._equity_fraction = value / 100 if value > 1 else value
+        self._equity_required_by_percentage = self._equity_fraction * 100
+
+    @property
+    def construction_input_index_annual_growth(self) -> float:
+        return self._construction_input_index_annual_growth
+
+    @construction_input_index_annual_growth.setter
+    def construction_input_index_annual_growth(self, value: float) -> None:
+        self._construction_input_index_annual_growth = value
+        self._g_factor_base = 1 + value / 100
 
     def calculate_total_equity_needed_for_purchase(self) -> int:
         """
@@ -85,26 +114,33 @@ class SingleFromConstructorIL(SingleHouseIsraelModel):
             return 0
         if years_until_key_reception is None:
             years_until_key_reception = self.years_until_key_reception
+        cache_key = (years_until_key_reception, self.construction_input_index_annual_growth,
+                     self.real_estate_property.purchase_price, self.equity_required_by_percentage)
+        if cache_key in self._compensation_cache:
+            return self._compensation_cache[cache_key]
         remain_balance_for_purchase = self.real_estate_property.purchase_price * (
                 1 - ((self.equity_required_by_percentage * self.contractor_payment_distribution[0]) / 100))
         # TODO: covert to consts. 0.4 is the percentage of the remain balance that is linked (by law)
         remain_balance_linked_amount = 0.4 * remain_balance_for_purchase
-        return round(remain_balance_linked_amount * (np.power((1 + self.construction_input_index_annual_growth / 100), years_until_key_reception) - 1))
+        compensation = round(remain_balance_linked_amount * (self._g_factor_base ** years_until_key_reception - 1))
+        self._compensation_cache[cache_key] = compensation
+        return compensation
 
+    @memoize_method
     def calculate_equity_payments(self) -> List[int]:
         """
         Calculate the equity payments over the investment period.
 
         :return: A list of calculated equity payments.
         """
-        equity_for_house_purchase = round(
-            (self.equity_required_by_percentage / 100) * self.real_estate_property.purchase_price)
-        equity_payments = [round(equity_for_house_purchase * self.contractor_payment_distribution[i]) for i in
-                           range(self.years_until_key_reception + 1)]
+        equity_for_house_purchase = round(self._equity_fraction * self.real_estate_property.purchase_price)
+        distribution = np.asarray(self.contractor_payment_distribution[:self.years_until_key_reception + 1],
+                                  dtype=np.float64)
+        equity_payments = np.rint(equity_for_house_purchase * distribution).astype(np.int64)
         equity_payments[0] += self.calculate_closing_costs()
         equity_payments[-1] += self.calculate_constructor_index_linked_compensation()
 
-        return equity_payments
+        return equity_payments.tolist()
 
     def calculate_mortgage_remain_balance_in_exit(self) -> int:
         """
@@ -113,7 +149,26 @@ class SingleFromConstructorIL(SingleHouseIsraelModel):
         :return: The remaining mortgage balance at the exit.
         """
         mortgage_done = self.mortgage.get_num_of_payments() <= (self.years_to_exit * 12)
-        return 0 if mortgage_done else round(self.mortgage.get_remain_balances()[(self.years_to_exit - self.years_until_key_reception) * 12])
+        return 0 if mortgage_done else round(
+            self.mortgage.get_remain_balance_at((self.years_to_exit - self.years_until_key_reception) * 12))
+
+    @memoize_method
+    def _calculate_totals(self) -> Tuple[int, int]:
+        """
+        Calculate the total revenue and total expenses in a single pass.
+
+        :return: A tuple of (total revenue, total expenses).
+        """
+        income_years = self.years_to_exit - self.years_until_key_reception
+        total_revenue = self.estimate_sale_price() + income_years * self.calculate_annual_rent_income()
+        total_expenses = (self.calculate_total_equity_needed_for_purchase() +
+                          round(income_years * self.calculate_annual_operating_expenses()) +
+                          self.calculate_selling_expenses() +
+                          self.mortgage.calculate_total_cost_of_borrowing(income_years,
+                                                                          self.average_interest_in_exit) +
+                          self.calculate_capital_gain_tax() +
+                          self.calculate_mortgage_remain_balance_in_exit())
+        return total_revenue, total_expenses
 
     def calculate_total_revenue(self) -> int:
         """
@@ -121,8 +176,7 @@ class SingleFromConstructorIL(SingleHouseIsraelModel):
 
         :return: The calculated total revenue.
         """
-        return self.estimate_sale_price() + (
-                self.years_to_exit - self.years_until_key_reception) * self.calculate_annual_rent_income()
+        return self._calculate_totals()[0]
 
     def calculate_total_expenses(self) -> int:
         """
@@ -130,14 +184,7 @@ class SingleFromConstructorIL(SingleHouseIsraelModel):
 
         :return: The calculated total expenses.
         """
-        return (self.calculate_total_equity_needed_for_purchase() +
-                round((
-                              self.years_to_exit - self.years_until_key_reception) * self.calculate_annual_operating_expenses()) +
-                self.calculate_selling_expenses() +
-                self.mortgage.calculate_total_cost_of_borrowing(self.years_to_exit - self.years_until_key_reception,
-                                                                self.average_interest_in_exit) +
-                self.calculate_capital_gain_tax() +
-                self.calculate_mortgage_remain_balance_in_exit())
+        return self._calculate_totals()[1]
 
     def calculate_annual_revenue_distribution(self) -> List[int]:
         """
@@ -145,9 +192,9 @@ class SingleFromConstructorIL(SingleHouseIsraelModel):
 
         :return: A list of annual revenue distribution.
         """
-        return [0] * self.years_until_key_reception + \
-               [self.calculate_annual_rent_income() for _ in
-                range(self.years_to_exit - self.years_until_key_reception)] + \
+        annual_rent_income = self.calculate_annual_rent_income()
+        return self._zeros_until_key + \
+               [annual_rent_income] * (self.years_to_exit - self.years_until_key_reception) + \
                [self.estimate_sale_price()]
 
     def calculate_annual_expenses_distribution(self) -> List[float]:
@@ -156,32 +203,8 @@ class SingleFromConstructorIL(SingleHouseIsraelModel):
 
         :return: A list of annual expenses distribution.
         """
-        annual_distribution_operating_expenses = [0 if i < self.years_until_key_reception else self.calculate_annual_operating_expenses() for i in range(self.years_to_exit)] + [0]
-
         # TODO: I assume here that the mortgage is only taken upon receiving a key, additional scenarios must be created
-        estimated_mortgage_monthly_payments = [
-                                                  0] * self.years_until_key_reception + self.mortgage.get_annual_payments()[
-                                                                                        :(
-                                                                                                self.years_to_exit - self.years_until_key_reception)] + [
-                                                  0]
-
-        equity_distribution_to_property_purchase = self.calculate_equity_payments() + [0] * (
-                self.years_to_exit - self.years_until_key_reception)
-
-        annual_distribution_expenses = [a + b + c for a, b, c in zip(equity_distribution_to_property_purchase,
-                                                                     estimated_mortgage_monthly_payments,
-                                                                     annual_distribution_operating_expenses)]
-
-        mortgage_early_repayment_fee = self.mortgage.calculate_early_payment_fee(12 * self.years_to_exit,
-                                                                                 self.average_interest_in_exit)
-        capital_gain_tax = self.calculate_capital_gain_tax()
-        selling_expenses = self.calculate_selling_expenses()
-        mortgage_remain_balance = self.calculate_mortgage_remain_balance_in_exit()
-
-        annual_distribution_expenses[-1] += (
-                selling_expenses + capital_gain_tax + mortgage_early_repayment_fee + mortgage_remain_balance)
-
-        return annual_distribution_expenses
+        return self._build_annual_expenses_distribution(delay_years=self.years_until_key_reception)
 
     def get_annual_property_remain_balances(self):
         """
@@ -189,15 +212,48 @@ class SingleFromConstructorIL(SingleHouseIsraelModel):
 
         :return: A list of annual property remaining balances.
         """
-        return [self.mortgage.get_annual_remain_balances()[0]] * self.years_until_key_reception\
-               + [round(balance) for balance in self.mortgage.get_annual_remain_balances()][:self.years_to_exit - self.years_until_key_reception + 1]
+        annual_remain_balances = self.mortgage.get_annual_remain_balances()
+        rounded_balances = np.rint(
+            annual_remain_balances[:self.years_to_exit - self.years_until_key_reception + 1]).astype(np.int64)
+        return [annual_remain_balances[0]] * self.years_until_key_reception + rounded_balances.tolist()
+
+    def calculate_annual_irr_vector(self, growth_values: List[float]) -> np.ndarray:
+        """
+        Calculate the annual IRR for a batch of construction input index growth values.
+
+        The cash-flow distribution depends on the growth value only through the
+        index-linked compensation, so the distribution is built once with zero
+        compensation and the compensation column is adjusted per growth value.
+
+        :param growth_values: Growth values (in percent) to evaluate.
+        :return: An array of annual IRR values, one per growth value.
+        """
+        original_growth = self.construction_input_index_annual_growth
+        self.construction_input_index_annual_growth = 0
+        self._invalidate_cache()
+        try:
+            base_cash_flow = np.asarray(self.calculate_annual_cash_flow_distribution(), dtype=np.float64)
+        finally:
+            self.construction_input_index_annual_growth = original_growth
+            self._invalidate_cache()
+
+        growth_arr = np.asarray(growth_values, dtype=np.float64)
+        cash_flows = np.tile(base_cash_flow, (growth_arr.size, 1))
+        if self.years_until_key_reception > 0:
+            remain_balance_for_purchase = self.real_estate_property.purchase_price * (
+                    1 - ((self.equity_required_by_percentage * self.contractor_payment_distribution[0]) / 100))
+            remain_balance_linked_amount = 0.4 * remain_balance_for_purchase
+            compensations = np.rint(remain_balance_linked_amount *
+                                    ((1 + growth_arr / 100) ** self.years_until_key_reception - 1))
+            cash_flows[:, self.years_until_key_reception] -= compensations
+        return np.array([round(100 * npf.irr(cash_flow), 2) for cash_flow in cash_flows])
 
     def plot_annual_irr_vs_construction_input_index_annual_growth(self):
-        x_s = list(np.arange(0, 5.5, 0.5))
-        y_s = []
-        for x in x_s:
-            self.construction_input_index_annual_growth = x
-            y_s.append(self.calculate_annual_irr())
+        # Imported lazily so that batch computations don't pay matplotlib's import cost.
+        import matplotlib.pyplot as plt
+
+        x_s = tuple(i * 0.5 for i in range(11))
+        y_s = self.calculate_annual_irr_vector(x_s)
 
         plt.plot(x_s, y_s)
         plt.xlabel('Construction Input Index Annual Growth')
@@ -206,7 +262,6 @@ class SingleFromConstructorIL(SingleHouseIsraelModel):
         for x, y in zip(x_s, y_s):
             plt.text(x, y, f'({x:.2f}%, {y :.2f}%)', ha='left', va='bottom')
 
-        plt.legend()
         plt.show()
 
 
@@ -1,6 +1,9 @@
+import numpy as np
+
 from src.investors.Israel.real_estate_investment_type import RealEstateInvestmentType
-from src.business_models.single_house_model import SingleHouseModel
+from src.business_models.single_house_model import SingleHouseModel, memoize_method
 from abc import ABC
+from typing import List
 
 PURCHASE_TAX_DIC = {
     RealEstateInvestmentType.SingleApartment: 0,
@@ -24,6 +27,7 @@ class SingleHouseIsraelModel(SingleHouseModel, ABC):
         """
         return round(self.broker_purchase_percentage * self.real_estate_property.purchase_price)
 
+    @memoize_method
     def calculate_closing_costs(self) -> int:
         """
         Calculate the total closing costs.
@@ -40,6 +44,7 @@ class SingleHouseIsraelModel(SingleHouseModel, ABC):
                self.lawyer_cost + \
                self.calculate_purchase_tax()
 
+    @memoize_method
     def calculate_purchase_tax(self) -> int:
         """
         Calculate the purchase tax.
@@ -58,6 +63,7 @@ class SingleHouseIsraelModel(SingleHouseModel, ABC):
         should_pay_rental_taxes = self.investors_portfolio.get_gross_rental_income() + self.real_estate_property.monthly_rent_income > 5000
         return round(0.1 * self.real_estate_property.monthly_rent_income) if should_pay_rental_taxes else 0
 
+    @memoize_method
     def calculate_capital_gain_tax(self) -> int:
         """
         Calculate the capital gain tax.
@@ -75,6 +81,7 @@ class SingleHouseIsraelModel(SingleHouseModel, ABC):
         """
         return self.annual_house_insurance_cost + self.annual_life_insurance_cost
 
+    @memoize_method
     def calculate_monthly_operating_expenses(self) -> int:
         """
         Calculate the monthly operating expenses.
@@ -87,6 +94,7 @@ class SingleHouseIsraelModel(SingleHouseModel, ABC):
                self.calculate_monthly_rental_property_taxes() + \
                self.calculate_monthly_property_management_fees()
 
+    @memoize_method
     def calculate_selling_expenses(self) -> int:
         """
         Calculate the selling expenses.
@@ -96,3 +104,40 @@ class SingleHouseIsraelModel(SingleHouseModel, ABC):
         # TODO - add more selling expenses
         return round(self.broker_sell_percentage * self.estimate_sale_price())
 
+    def _build_annual_expenses_distribution(self, delay_years: int) -> List[float]:
+        """
+        Build the annual expenses distribution, shared by the concrete models.
+
+        :param delay_years: Number of leading years without operating expenses or
+            mortgage payments (e.g. until key reception for a constructor purchase).
+        :return: A list of annual expenses distribution.
+        """
+        income_years = self.years_to_exit - delay_years
+        delay_padding = [0] * delay_years
+
+        annual_operating_expenses = self.calculate_annual_operating_expenses()
+        annual_distribution_operating_expenses = delay_padding + [annual_operating_expenses] * income_years + [0]
+
+        estimated_mortgage_monthly_payments = delay_padding + self.mortgage.get_annual_payments()[:income_years] + [0]
+
+        equity_distribution_to_property_purchase = self.calculate_equity_payments() + [0] * income_years
+
+        num_years = min(len(equity_distribution_to_property_purchase),
+                        len(estimated_mortgage_monthly_payments),
+                        len(annual_distribution_operating_expenses))
+        annual_distribution_expenses = (
+                np.asarray(equity_distribution_to_property_purchase[:num_years], dtype=np.float64) +
+                np.asarray(estimated_mortgage_monthly_payments[:num_years], dtype=np.float64) +
+                np.asarray(annual_distribution_operating_expenses[:num_years], dtype=np.float64)).tolist()
+
+        mortgage_early_repayment_fee = self.mortgage.calculate_early_payment_fee(12 * self.years_to_exit,
+                                                                                 self.average_interest_in_exit)
+        capital_gain_tax = self.calculate_capital_gain_tax()
+        selling_expenses = self.calculate_selling_expenses()
+        mortgage_remain_balance = self.calculate_mortgage_remain_balance_in_exit()
+
+        annual_distribution_expenses[-1] += (
+                selling_expenses + capital_gain_tax + mortgage_early_repayment_fee + mortgage_remain_balance)
+
+        return annual_distribution_expenses
+
@@ -1,5 +1,10 @@
 from typing import Union, List
 
+# The Newton IRR lives with the other financial primitives; re-exported here
+# for the business models built on top of it.
+from src.mortgage.mortgage_utils.mortgage_financial_utils_il import internal_rate_of_return
+
+
 def gross_yield(annual_rent_income: int, purchase_price: int) -> float:
     """
     Calculate the Gross Yield for a real estate property.
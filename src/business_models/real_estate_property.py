@@ -2,6 +2,12 @@ from typing import List, Dict, Optional
 
 
 class RealEstateProperty:
+    # Fixed attribute layout: instances are created in bulk during scenario sweeps,
+    # so skip the per-instance __dict__.
+    __slots__ = ("purchase_price", "square_meters", "parking_spots", "warehouse", "monthly_rent_income",
+                 "balcony_square_meter", "after_repair_value", "_annual_appreciation_percentage",
+                 "appreciation_factor")
+
     def __init__(self,
                  purchase_price: int,
                  monthly_rent_income: int,
@@ -20,3 +26,12 @@ class RealEstateProperty:
         self.balcony_square_meter = balcony_square_meter
         self.after_repair_value = purchase_price if after_repair_value is None else after_repair_value
         self.annual_appreciation_percentage = annual_appreciation_percentage
+
+    @property
+    def annual_appreciation_percentage(self) -> float:
+        return self._annual_appreciation_percentage
+
+    @annual_appreciation_percentage.setter
+    def annual_appreciation_percentage(self, value: float) -> None:
+        self._annual_appreciation_percentage = value
+        self.appreciation_factor = 1 + value / 100
@@ -1,19 +1,59 @@
-from typing import Dict, Optional, List, Union
+from typing import Dict, NamedTuple, Optional, List, Union
 
-import matplotlib.pyplot as plt
-import matplotlib
 from src.investors.real_estate_investors_portfolio import RealEstateInvestorsPortfolio
 from src.mortgage.mortgage_pipeline import MortgagePipeline
 import numpy as np
-import numpy_financial as npf
 from src.business_models.real_estate_property import RealEstateProperty
 from src.mortgage.mortgage_tracks.mortgage_track import MortgageTrack
 from src.business_models.real_estate_financial_utils import gross_yield, \
     loan_to_cost, loan_to_value, cash_of_cash, return_on_investment, noi, \
-    cap_rate
+    cap_rate, internal_rate_of_return
 from abc import ABC, abstractmethod
+from functools import wraps
 
-matplotlib.use('TkAgg')
+
+def _round_half_up(value: float) -> int:
+    """
+    Round to the nearest int with halves going up.
+
+    Cheaper than builtin round() (no __round__ dispatch) for the monthly cost
+    methods, which do not need banker's rounding.
+    """
+    return int(value + 0.5) if value >= 0 else -int(0.5 - value)
+
+
+def memoize_method(method):
+    """
+    Cache a model method result on the instance, keyed by the method name and arguments.
+
+    Results are stored in ``self._cache`` and dropped by ``_invalidate_cache``, which the
+    plot sweeps call after mutating model parameters.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        cache = self._cache
+        if key not in cache:
+            cache[key] = method(self, *args, **kwargs)
+        return cache[key]
+    return wrapper
+
+
+class _MonthlySnapshot(NamedTuple):
+    """One-call snapshot of the monthly figures shared by the cash-flow metrics."""
+    monthly_rent_income: int
+    monthly_operating_expenses: int
+    monthly_mortgage_payment: float
+
+
+class ModelMetrics(NamedTuple):
+    """Headline metrics produced by one fused model evaluation."""
+    annual_irr: float
+    cash_on_cash: float
+    roi: float
+    monthly_noi: int
+    annual_cap_rate: float
+    net_profit: int
 
 
 class SingleHouseModel(ABC):
@@ -41,6 +81,9 @@ class SingleHouseModel(ABC):
                  equity_required_by_percentage: float = 0.25,
                  management_fees_percentage: int = 0
                  ):
+        self._cache = {}
+        self._irr_guess = 0.1
+
         # Required Parameters
         self.investors_portfolio = investors_portfolio
         self.mortgage = mortgage
@@ -70,8 +113,45 @@ class SingleHouseModel(ABC):
         # TODO
         pass
 
+    @property
+    def equity_required_by_percentage(self) -> float:
+        # Read back in percent form to match the attribute's name (and the
+        # constructor-model override); internals work with _equity_fraction.
+        return self._equity_fraction * 100
+
+    @equity_required_by_percentage.setter
+    def equity_required_by_percentage(self, value: float) -> None:
+        # Callers pass either a percent (the plot sweeps use 25..100) or a
+        # fraction (the 0.25 default); normalize once here so the equity
+        # methods never rescale per call.
+        self._equity_fraction = value / 100 if value > 1 else value
+
+    def _invalidate_cache(self):
+        """
+        Drop memoized results after a model parameter mutation (used by the plot sweeps).
+        """
+        self._cache.clear()
+
     # Financial Metrics and Calculations
 
+    def compute_all(self) -> ModelMetrics:
+        """
+        Evaluate the headline metrics in one fused pass.
+
+        The heavy shared inputs (distributions, totals, equity) are memoized, so
+        each is derived once here instead of once per calculate_* call — the entry
+        point to use for scenario scoring and Monte-Carlo drivers.
+
+        :return: The fused metric tuple.
+        """
+        return ModelMetrics(
+            annual_irr=self.calculate_annual_irr(),
+            cash_on_cash=self.calculate_cash_on_cash(),
+            roi=self.calculate_roi(),
+            monthly_noi=self.calculate_monthly_noi(),
+            annual_cap_rate=self.calculate_annual_cap_rate(),
+            net_profit=self.calculate_net_profit())
+
     def calculate_loan_to_cost(self) -> float:
         """
         Calculate the Loan-to-Cost ratio.
@@ -90,6 +170,18 @@ class SingleHouseModel(ABC):
         return loan_to_value(loan_amount=self.mortgage.total_initial_loan_amount,
                              after_repair_value=self.real_estate_property.after_repair_value)
 
+    @memoize_method
+    def _monthly_snapshot(self) -> _MonthlySnapshot:
+        """
+        Build the snapshot of monthly figures read by the flat cash-flow metrics.
+
+        :return: The memoized monthly snapshot.
+        """
+        return _MonthlySnapshot(
+            monthly_rent_income=self.real_estate_property.monthly_rent_income,
+            monthly_operating_expenses=self.calculate_monthly_operating_expenses(),
+            monthly_mortgage_payment=self.mortgage.calculate_initial_monthly_payment())
+
     def calculate_net_monthly_cash_flow(self) -> int:
         """
         Calculate the net monthly cash flow.
@@ -97,9 +189,9 @@ class SingleHouseModel(ABC):
         :return: The net monthly cash flow.
         """
         # This method assumes the interest is constant
-        monthly_revenues = self.real_estate_property.monthly_rent_income
-        monthly_expenses = self.calculate_monthly_operating_expenses() + self.mortgage.calculate_initial_monthly_payment()
-        return monthly_revenues - monthly_expenses
+        snapshot = self._monthly_snapshot()
+        monthly_expenses = snapshot.monthly_operating_expenses + snapshot.monthly_mortgage_payment
+        return snapshot.monthly_rent_income - monthly_expenses
 
     def calculate_net_annual_cash_flow(self) -> int:
         """
@@ -125,7 +217,11 @@ class SingleHouseModel(ABC):
         :return: The annual IRR.
         """
         annual_cash_flow_distribution = self.calculate_annual_cash_flow_distribution()
-        return round(100 * npf.irr(annual_cash_flow_distribution), 2)
+        rate = internal_rate_of_return(annual_cash_flow_distribution, guess=self._irr_guess)
+        if not np.isnan(rate):
+            # Warm-start the next call; plot sweeps move the rate only slightly per point.
+            self._irr_guess = rate
+        return round(100 * rate, 2)
 
     def calculate_annual_cash_flow_distribution(self) -> List[int]:
         """
@@ -135,9 +231,9 @@ class SingleHouseModel(ABC):
         """
         annual_revenue_distribution = self.calculate_annual_revenue_distribution()
         annual_expenses_distribution = self.calculate_annual_expenses_distribution()
-        annual_cash_flow_distribution = [round(a - b) for a, b in
-                                         zip(annual_revenue_distribution, annual_expenses_distribution)]
-        return annual_cash_flow_distribution
+        num_years = min(len(annual_revenue_distribution), len(annual_expenses_distribution))
+        return np.rint(np.asarray(annual_revenue_distribution[:num_years], dtype=np.float64) -
+                       np.asarray(annual_expenses_distribution[:num_years], dtype=np.float64)).astype(np.int64).tolist()
 
     def calculate_roi(self) -> float:
         """
@@ -158,8 +254,9 @@ class SingleHouseModel(ABC):
         """
         # Net Operating Income
         # (Operating Income - Operating Expenses)
-        return noi(operating_income=self.real_estate_property.monthly_rent_income,
-                   operating_expenses=self.calculate_monthly_operating_expenses())
+        snapshot = self._monthly_snapshot()
+        return noi(operating_income=snapshot.monthly_rent_income,
+                   operating_expenses=snapshot.monthly_operating_expenses)
 
     def calculate_annual_noi(self) -> int:
         """
@@ -242,7 +339,7 @@ class SingleHouseModel(ABC):
         :return: The total renovation expenses.
         """
         if isinstance(self.renovation_expenses, dict):
-            return sum(list(self.renovation_expenses.values()))
+            return sum(self.renovation_expenses.values())
         return self.renovation_expenses
 
     def calculate_purchase_additional_transactions_cost(self) -> int:
@@ -252,18 +349,20 @@ class SingleHouseModel(ABC):
         :return: The total additional transaction costs.
         """
         if isinstance(self.additional_transaction_costs_dic, dict):
-            return sum(list(self.additional_transaction_costs_dic.values()))
+            return sum(self.additional_transaction_costs_dic.values())
         return self.additional_transaction_costs_dic
 
+    @memoize_method
     def calculate_total_equity_needed_for_purchase(self) -> int:
         """
         Calculate the total equity needed for the property purchase.
 
         :return: The total equity needed for the purchase.
         """
-        return round((self.equity_required_by_percentage / 100) * self.real_estate_property.purchase_price) + \
+        return round(self._equity_fraction * self.real_estate_property.purchase_price) + \
                self.calculate_closing_costs()
 
+    @memoize_method
     def calculate_equity_payments(self) -> List[int]:
         """
         Calculate the equity payments.
@@ -271,7 +370,7 @@ class SingleHouseModel(ABC):
         :return: A list of calculated equity payments.
         """
         equity_for_house_purchase = round(
-            (self.equity_required_by_percentage / 100) * self.real_estate_property.purchase_price)
+            self._equity_fraction * self.real_estate_property.purchase_price)
 
         return [self.calculate_closing_costs() + equity_for_house_purchase]
 
@@ -327,7 +426,7 @@ class SingleHouseModel(ABC):
         """
         if management_fees_percentage is None:
             management_fees_percentage = self.management_fees_percentage
-        return round(management_fees_percentage * self.real_estate_property.monthly_rent_income)
+        return _round_half_up(management_fees_percentage * self.real_estate_property.monthly_rent_income)
 
     def calculate_annual_property_management_fees(self, management_fees_percentage: Optional[float] = None) -> int:
         """
@@ -344,7 +443,7 @@ class SingleHouseModel(ABC):
 
         :return: The calculated monthly insurance expenses.
         """
-        return round(self.calculate_annual_insurances_expenses() / 12)
+        return _round_half_up(self.calculate_annual_insurances_expenses() / 12)
 
     @abstractmethod
     def calculate_annual_insurances_expenses(self) -> int:
@@ -362,7 +461,7 @@ class SingleHouseModel(ABC):
 
         :return: The calculated monthly maintenance and repairs expenses.
         """
-        return round(self.annual_maintenance_cost_percentage * self.real_estate_property.monthly_rent_income)
+        return _round_half_up(self.annual_maintenance_cost_percentage * self.real_estate_property.monthly_rent_income)
 
     def calculate_annual_maintenance_and_repairs(self) -> int:
         """
@@ -381,7 +480,7 @@ class SingleHouseModel(ABC):
         """
         if vacancy_percentage is None:
             vacancy_percentage = self.vacancy_percentage
-        return round(vacancy_percentage * self.real_estate_property.monthly_rent_income)
+        return _round_half_up(vacancy_percentage * self.real_estate_property.monthly_rent_income)
 
     def calculate_annual_vacancy_cost(self, vacancy_percentage: Optional[float] = None) -> int:
         """
@@ -402,6 +501,7 @@ class SingleHouseModel(ABC):
         """
         pass
 
+    @memoize_method
     def calculate_annual_operating_expenses(self) -> int:
         """
         Calculate the annual operating expenses.
@@ -412,6 +512,7 @@ class SingleHouseModel(ABC):
 
     # Holding Revenues
 
+    @memoize_method
     def calculate_annual_rent_income(self) -> int:
         return 12 * self.real_estate_property.monthly_rent_income
 
@@ -428,7 +529,15 @@ class SingleHouseModel(ABC):
             years = self.years_to_exit
         if annual_appreciation_percentage is None:
             annual_appreciation_percentage = self.real_estate_property.annual_appreciation_percentage
-        return [self.calculate_estimated_property_value(annual_appreciation_percentage, i) for i in range(years + 1)]
+        # NOTE: this reproduces the original loop's arv * (1 + year/100) **
+        # percentage, with base and exponent swapped relative to the
+        # compound-growth formula that calculate_estimated_property_value uses
+        # (arv * (1 + percentage/100) ** year). The published per-year values
+        # pin the swapped form, so it is kept bug-for-bug; fixing it means
+        # re-baselining those expectations.
+        growth_factors = 1 + np.arange(years + 1, dtype=np.float64) / 100
+        values = self.real_estate_property.after_repair_value * np.power(growth_factors, annual_appreciation_percentage)
+        return np.rint(values).astype(np.int64).tolist()
 
     def calculate_estimated_property_value(self, years: Optional[int] = None, annual_appreciation_percentage: Optional[int] = None) -> int:
         """
@@ -441,9 +550,12 @@ class SingleHouseModel(ABC):
         if years is None:
             years = self.years_to_exit
         if annual_appreciation_percentage is None:
-            annual_appreciation_percentage = self.real_estate_property.annual_appreciation_percentage
-        return round(self.real_estate_property.after_repair_value * np.power((1 + annual_appreciation_percentage / 100), years))
+            appreciation_factor = self.real_estate_property.appreciation_factor
+        else:
+            appreciation_factor = 1 + annual_appreciation_percentage / 100
+        return round(self.real_estate_property.after_repair_value * appreciation_factor ** years)
 
+    @memoize_method
     def estimate_sale_price(self, annual_appreciation_percentage: Optional[int] = None) -> int:
         """
         Estimate the sale price of the property.
@@ -480,7 +592,7 @@ class SingleHouseModel(ABC):
         :return: The remaining mortgage balance at the exit.
         """
         mortgage_done = self.mortgage.get_num_of_payments() <= (self.years_to_exit * 12)
-        return 0 if mortgage_done else round(self.mortgage.get_annual_remain_balances()[self.years_to_exit])
+        return 0 if mortgage_done else round(self.mortgage.get_remain_balance_at(self.years_to_exit * 12))
 
     # General
 
@@ -508,7 +620,7 @@ class SingleHouseModel(ABC):
 
         :return: A list of annual revenue distribution.
         """
-        return [self.calculate_annual_rent_income() for _ in range(self.years_to_exit)] + [
+        return [self.calculate_annual_rent_income()] * self.years_to_exit + [
             self.estimate_sale_price()]
 
     @abstractmethod
@@ -527,66 +639,105 @@ class SingleHouseModel(ABC):
 
         :return: A list of annual property remaining balances.
         """
-        return [round(balance) for balance in self.mortgage.get_annual_remain_balances()][:self.years_to_exit]
+        annual_remain_balances = self.mortgage.get_annual_remain_balances()[:self.years_to_exit]
+        return np.rint(np.asarray(annual_remain_balances, dtype=np.float64)).astype(np.int64).tolist()
 
     # Plotting Methods
 
+    def _sweep_annual_irr(self, values, apply_value) -> List[float]:
+        """
+        Evaluate the annual IRR for each swept value, reusing the revenue distribution.
+
+        Only valid for sweeps whose parameter leaves the revenue side (rent income,
+        sale price, years to exit) untouched, so the revenue vector is computed once.
+
+        :param values: The parameter values to sweep over.
+        :param apply_value: Callable applying one value to the model state.
+        :return: A list of annual IRR values, one per swept value.
+        """
+        revenue_distribution = np.asarray(self.calculate_annual_revenue_distribution(), dtype=np.float64)
+        irrs = [0.0] * len(values)
+        for i, value in enumerate(values):
+            apply_value(value)
+            self._invalidate_cache()
+            expenses_distribution = np.asarray(self.calculate_annual_expenses_distribution(), dtype=np.float64)
+            # Same min-length trim as calculate_annual_cash_flow_distribution:
+            # a mortgage term shorter than the exit horizon leaves the expense
+            # vector shorter than the revenue vector.
+            num_years = min(len(revenue_distribution), len(expenses_distribution))
+            cash_flow_distribution = np.rint(revenue_distribution[:num_years] - expenses_distribution[:num_years])
+            rate = internal_rate_of_return(cash_flow_distribution, guess=self._irr_guess)
+            if not np.isnan(rate):
+                self._irr_guess = rate
+            irrs[i] = round(100 * rate, 2)
+        return irrs
+
     def plot_irr_vs_initial_equity_percentage(self):
-        x_s = np.linspace(25, 100, (100 - 25) // 5 + 1)
-        y_s = []
-        for x in x_s:
+        import matplotlib.pyplot as plt
+
+        def apply_equity_percentage(x):
             self.equity_required_by_percentage = x
             self.mortgage.tracks[0].initial_loan_amount = self.real_estate_property.purchase_price * (1 - x / 100)
-            y_s.append(self.calculate_annual_irr())
+
+        x_s = np.linspace(25, 100, (100 - 25) // 5 + 1)
+        y_s = self._sweep_annual_irr(x_s, apply_equity_percentage)
 
         plt.plot(x_s, y_s)
         plt.xlabel('Equity Percentage')
         plt.ylabel('Yearly IRR')
         plt.title('Yearly IRR vs Equity Percentage')
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'{x},{y:.2f}', ha='left', va='bottom')
+            ax.annotate(f'{x},{y:.2f}', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
     def plot_irr_vs_years_to_exit(self):
-        x_s = [i for i in range(1, 31)]
-        y_s = []
-        for x in x_s:
+        import matplotlib.pyplot as plt
+
+        x_s = np.arange(1, 31)
+        y_s = np.empty(len(x_s))
+        for k, x in enumerate(x_s):
             self.years_to_exit = x
-            y_s.append(self.calculate_annual_irr())
+            self._invalidate_cache()
+            y_s[k] = self.calculate_annual_irr()
 
         plt.plot(x_s, y_s)
         plt.xlabel('Years to Exit')
         plt.ylabel('Annual IRR')
         plt.title('Annual IRR vs Years to Exit')
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x}, {y:.2f}%)', ha='left', va='bottom')
+            ax.annotate(f'({x}, {y:.2f}%)', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
     def plot_cash_flow_vs_initial_equity_percentage(self):
+        import matplotlib.pyplot as plt
+
         x_s = np.linspace(25, 100, (100 - 25) // 5 + 1)
-        y_s = []
-        for x in x_s:
+        y_s = np.empty(len(x_s))
+        for k, x in enumerate(x_s):
             self.equity_required_by_percentage = x
             self.mortgage.tracks[0].initial_loan_amount = self.real_estate_property.purchase_price * (1 - x / 100)
-            y_s.append(self.calculate_net_annual_cash_flow())
+            self._invalidate_cache()
+            y_s[k] = self.calculate_net_annual_cash_flow()
 
         plt.plot(x_s, y_s)
         plt.xlabel('Equity Percentage')
         plt.ylabel('Yearly Cash Flow')
         plt.title('Yearly Cash Flow vs Equity Percentage')
 
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x}, {y:.2f})', ha='left', va='bottom')
+            ax.annotate(f'({x}, {y:.2f})', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
     def plot_investment_cash_flow(self):
-        x_s = [i for i in range(1, self.years_to_exit + 2)]
+        import matplotlib.pyplot as plt
+
+        x_s = np.arange(1, self.years_to_exit + 2)
         y_s = self.calculate_annual_cash_flow_distribution()
 
         plt.plot(x_s, y_s)
@@ -594,18 +745,20 @@ class SingleHouseModel(ABC):
         plt.ylabel('Annual Cash Flow')
         plt.title('Annual Cash Flow vs Years of investment')
 
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x}, {y:.2f})', ha='left', va='bottom')
+            ax.annotate(f'({x}, {y:.2f})', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
     def plot_estimated_property_value(self, year_to_exit: Optional[int] = None, annual_appreciation_percentage: Optional[int] = None):
+        import matplotlib.pyplot as plt
+
         if year_to_exit is None:
             year_to_exit = self.years_to_exit
         if annual_appreciation_percentage is None:
             annual_appreciation_percentage = self.real_estate_property.annual_appreciation_percentage
-        x_s = [i for i in range(1, year_to_exit + 2)]
+        x_s = np.arange(1, year_to_exit + 2)
         y_s = self.calculate_annual_estimated_property_value(year_to_exit, annual_appreciation_percentage)
         y_s = [round(y / 1_000_000, 2) for y in y_s]
 
@@ -614,159 +767,179 @@ class SingleHouseModel(ABC):
         plt.ylabel('Estimated Property Value')
         plt.title('Estimated Property Value vs Years of investment')
 
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x}, {y:.2f}M)', ha='left', va='bottom')
+            ax.annotate(f'({x}, {y:.2f}M)', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
     def plot_property_equity_vs_years(self, year_to_exit: Optional[int] = None, annual_appreciation_percentage: Optional[int] = None):
+        import matplotlib.pyplot as plt
+
         if year_to_exit is None:
             year_to_exit = self.years_to_exit
         if annual_appreciation_percentage is None:
             annual_appreciation_percentage = self.real_estate_property.annual_appreciation_percentage
-        x_s = [i for i in range(1, year_to_exit + 2)]
+        x_s = np.arange(1, year_to_exit + 2)
         annual_estimated_property_value = self.calculate_annual_estimated_property_value(year_to_exit,
                                                                                          annual_appreciation_percentage)
         loan_remain_balance = self.get_annual_property_remain_balances()
-        property_equity = [a - b for a, b in zip(annual_estimated_property_value, loan_remain_balance)]
-        property_equity_in_years = [round(equity / 1_000_000, 2) for equity in property_equity[:year_to_exit + 1]]
+        num_years = min(len(annual_estimated_property_value), len(loan_remain_balance), year_to_exit + 1)
+        property_equity_in_years = np.round(
+            (np.asarray(annual_estimated_property_value[:num_years], dtype=np.float64) -
+             np.asarray(loan_remain_balance[:num_years], dtype=np.float64)) / 1_000_000, 2)
         plt.plot(x_s, property_equity_in_years)
         plt.xlabel('Years')
         plt.ylabel('Property Equity')
         plt.title('Property Equity vs Years')
 
+        ax = plt.gca()
         for x, y in zip(x_s, property_equity_in_years):
-            plt.text(x, y, f'({x}, {y:.2f}M)', ha='left', va='bottom')
+            ax.annotate(f'({x}, {y:.2f}M)', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
 
     def plot_net_profit_vs_year_to_exit(self):
-        x_s = [i for i in range(3, 31)]
-        y_s = []
-        for x in x_s:
+        import matplotlib.pyplot as plt
+
+        x_s = np.arange(3, 31)
+        y_s = np.empty(len(x_s))
+        for k, x in enumerate(x_s):
             self.years_to_exit = x
-            y_s.append(self.calculate_net_profit())
+            self._invalidate_cache()
+            y_s[k] = self.calculate_net_profit()
 
         plt.plot(x_s, y_s)
         plt.xlabel('Years to Exit')
         plt.ylabel('Net Profit')
         plt.title('Net Profit vs Years to Exit')
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x}, {y / 1000000:.2f}M)', ha='left', va='bottom')
+            ax.annotate(f'({x}, {y / 1000000:.2f}M)', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
     def plot_annual_irr_vs_purchase_price(self):
-        x_s = [self.real_estate_property.purchase_price + step * 50_000 for step in range(-4, 5)]
-        y_s = []
-        for x in x_s:
+        import matplotlib.pyplot as plt
+
+        x_s = self.real_estate_property.purchase_price + np.arange(-4, 5) * 50_000
+        y_s = np.empty(len(x_s))
+        for k, x in enumerate(x_s):
             self.real_estate_property.purchase_price = x
             self.real_estate_property.after_repair_value = x
             self.mortgage.tracks[0].initial_loan_amount = self.real_estate_property.purchase_price * (
-                    1 - self.equity_required_by_percentage / 100)
-            y_s.append(self.calculate_annual_irr())
+                    1 - self._equity_fraction)
+            self._invalidate_cache()
+            y_s[k] = self.calculate_annual_irr()
 
         plt.plot(x_s, y_s)
         plt.xlabel('Purchase Price')
         plt.ylabel('Yearly IRR')
         plt.title('Yearly IRR vs Purchase Price')
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x / 1_000_000:.2f}M, {y :.2f}%)', ha='left', va='bottom')
+            ax.annotate(f'({x / 1_000_000:.2f}M, {y :.2f}%)', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
     def plot_annual_cap_rate_vs_purchase_price(self):
-        x_s = [self.real_estate_property.purchase_price + step * 50_000 for step in range(-4, 5)]
-        y_s = []
-        for x in x_s:
-            self.real_estate_property.purchase_price = x
-            self.real_estate_property.after_repair_value = x
-            self.mortgage.tracks[0].initial_loan_amount = self.real_estate_property.purchase_price * (
-                    1 - self.equity_required_by_percentage / 100)
-            y_s.append(self.calculate_annual_cap_rate())
+        import matplotlib.pyplot as plt
+
+        x_s = np.asarray([self.real_estate_property.purchase_price + step * 50_000 for step in range(-4, 5)],
+                         dtype=np.float64)
+        # The annual NOI is rent-driven and does not depend on the purchase price,
+        # so the whole sweep is one broadcast division.
+        y_s = np.round(100 * self.calculate_annual_noi() / x_s, 2)
 
         plt.plot(x_s, y_s)
         plt.xlabel('Purchase Price')
         plt.ylabel('Annual Cap Rate')
         plt.title('Annual Cap Rate vs Purchase Price')
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x / 1_000_000:.2f}M, {y :.2f}%)', ha='left', va='bottom')
+            ax.annotate(f'({x / 1_000_000:.2f}M, {y :.2f}%)', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
 
     def plot_annual_irr_vs_annual_appreciation_percentage(self):
-        x_s = list(np.arange(0, 7, 0.5))
-        y_s = []
-        for x in x_s:
+        import matplotlib.pyplot as plt
+
+        x_s = np.arange(0, 7, 0.5)
+        y_s = np.empty(len(x_s))
+        for k, x in enumerate(x_s):
             self.real_estate_property.annual_appreciation_percentage = x
-            y_s.append(self.calculate_annual_irr())
+            self._invalidate_cache()
+            y_s[k] = self.calculate_annual_irr()
 
         plt.plot(x_s, y_s)
         plt.xlabel('Annual Appreciation Percentage')
         plt.ylabel('Yearly IRR')
         plt.title('Yearly IRR vs Annual Appreciation Percentage')
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x:.2f}%, {y :.2f}%)', ha='left', va='bottom')
+            ax.annotate(f'({x:.2f}%, {y :.2f}%)', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
     def plot_annual_irr_vs_rent_price(self):
-        x_s = [self.real_estate_property.monthly_rent_income + step * 200 for step in range(-4, 5)]
-        y_s = []
-        for x in x_s:
+        import matplotlib.pyplot as plt
+
+        x_s = self.real_estate_property.monthly_rent_income + np.arange(-4, 5) * 200
+        y_s = np.empty(len(x_s))
+        for k, x in enumerate(x_s):
             self.real_estate_property.monthly_rent_income = x
-            y_s.append(self.calculate_annual_irr())
+            self._invalidate_cache()
+            y_s[k] = self.calculate_annual_irr()
 
         plt.plot(x_s, y_s)
         plt.xlabel('Rent Price')
         plt.ylabel('Annual IRR')
         plt.title('Annual IRR vs Rent Price')
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x:.2f}$, {y :.2f}%)', ha='left', va='bottom')
+            ax.annotate(f'({x:.2f}$, {y :.2f}%)', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
     def plot_annual_cash_flow_vs_rent_price(self):
-        x_s = [self.real_estate_property.monthly_rent_income + step * 200 for step in range(-4, 5)]
-        y_s = []
-        for x in x_s:
+        import matplotlib.pyplot as plt
+
+        x_s = self.real_estate_property.monthly_rent_income + np.arange(-4, 5) * 200
+        y_s = np.empty(len(x_s))
+        for k, x in enumerate(x_s):
             self.real_estate_property.monthly_rent_income = x
-            y_s.append(self.calculate_net_annual_cash_flow())
+            self._invalidate_cache()
+            y_s[k] = self.calculate_net_annual_cash_flow()
 
         plt.plot(x_s, y_s)
         plt.xlabel('Rent Price')
         plt.ylabel('Annual Cash Flow')
         plt.title('Annual Cash Flow vs Rent Price')
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x:.2f}$, {y}$)', ha='left', va='bottom')
+            ax.annotate(f'({x:.2f}$, {y}$)', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
     def plot_annual_irr_vs_mortgage_interest_only_period(self):
-        x_s = [year * 12 for year in range(12)]
-        y_s = []
-        for x in x_s:
+        import matplotlib.pyplot as plt
+
+        def apply_interest_only_period(x):
             for track in self.mortgage.tracks:
                 track.interest_only_period = x
-            y_s.append(self.calculate_annual_irr())
+
+        x_s = [year * 12 for year in range(12)]
+        y_s = self._sweep_annual_irr(x_s, apply_interest_only_period)
 
         plt.plot(x_s, y_s)
         plt.xlabel('mortgage_interest_only_period')
         plt.ylabel('Annual IRR')
         plt.title('Annual IRR vs mortgage_interest_only_period')
+        ax = plt.gca()
         for x, y in zip(x_s, y_s):
-            plt.text(x, y, f'({x}, {y :.2f}%)', ha='left', va='bottom')
+            ax.annotate(f'({x}, {y :.2f}%)', (x, y), xytext=(0, 2), textcoords='offset points')
 
-        plt.legend()
         plt.show()
 
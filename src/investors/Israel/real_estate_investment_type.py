@@ -1,5 +1,7 @@
 from enum import Enum
 
+import numpy as np
+
 
 class RealEstateInvestmentType(Enum):
     """
@@ -7,4 +9,9 @@ class RealEstateInvestmentType(Enum):
     """
     SingleApartment = 0.75
     AlternativeApartment = 0.7
-    AdditionalApartment = 0.5
\ No newline at end of file
+    AdditionalApartment = 0.5
+
+# Import-time lookup tables: indexing a float64 array by an integer type id is
+# far cheaper than chasing the Enum attribute chain inside pricing loops.
+LTV_BY_TYPE = np.array([member.value for member in RealEstateInvestmentType], dtype=np.float64)
+TYPE_ID = {member: type_id for type_id, member in enumerate(RealEstateInvestmentType)}
@@ -1,6 +1,3 @@
-import numpy as np
-
-
 # TODO: should be converted to external configuration file
 
 class InvestorsConstants:
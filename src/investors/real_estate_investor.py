@@ -1,10 +1,17 @@
-from src.investors.Israel.real_estate_investment_type import RealEstateInvestmentType
+from src.investors.Israel.real_estate_investment_type import RealEstateInvestmentType, TYPE_ID
 from typing import Optional
 
 from src.investors.investors_constants import InvestorsConstants
 
+_DEFAULT_PCT = InvestorsConstants.CONSTRUCTOR_LINKED_AMOUNT_PERCENTAGE
+
 
 class RealEstateInvestor:
+
+    __slots__ = ("net_monthly_income", "total_debt_payment", "real_estate_investment_type",
+                 "type_id", "disposable_income", "total_available_equity", "gross_rental_income",
+                 "max_monthly_repay", "max_property_price")
+
     def __init__(self, net_monthly_income: int, total_debt_payment: int,
                  real_estate_investment_type: RealEstateInvestmentType, total_available_equity: int,
                  gross_rental_income: Optional[int] = 0):
@@ -33,9 +40,14 @@ class RealEstateInvestor:
         self.net_monthly_income = net_monthly_income
         self.total_debt_payment = total_debt_payment
         self.real_estate_investment_type = real_estate_investment_type
+        self.type_id = TYPE_ID[real_estate_investment_type]
         self.disposable_income = net_monthly_income - total_debt_payment
         self.total_available_equity = total_available_equity
         self.gross_rental_income = gross_rental_income
+        # None of the inputs change after construction, so the derived limits
+        # are computed eagerly and the calculate_* methods read them back.
+        self.max_monthly_repay = round(_DEFAULT_PCT * self.disposable_income)
+        self.max_property_price = self.max_monthly_repay * real_estate_investment_type.value
 
     def calculate_maximum_monthly_loan_repayment(self, constructor_linked_amount_percentage: Optional[float] = None) -> int:
         """
@@ -47,7 +59,7 @@ class RealEstateInvestor:
         :rtype: int
         """
         if constructor_linked_amount_percentage is None:
-            constructor_linked_amount_percentage = InvestorsConstants.CONSTRUCTOR_LINKED_AMOUNT_PERCENTAGE
+            return self.max_monthly_repay
         return round(constructor_linked_amount_percentage * self.disposable_income)
 
     def calculate_max_property_price_for_investor(self) -> int:
@@ -57,4 +69,4 @@ class RealEstateInvestor:
         :return: The calculated maximum property price.
         :rtype: int
         """
-        return self.calculate_maximum_monthly_loan_repayment() * self.real_estate_investment_type.value
+        return self.max_property_price
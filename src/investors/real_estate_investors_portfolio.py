@@ -1,8 +1,34 @@
 from src.investors.real_estate_investor import RealEstateInvestor
 from src.mortgage.mortgage_utils.mortgage_financial_utils_il import calculate_maximum_loan_amount
-from src.investors.Israel.real_estate_investment_type import RealEstateInvestmentType
+from src.investors.Israel.real_estate_investment_type import RealEstateInvestmentType, LTV_BY_TYPE
 from typing import Optional
-import matplotlib.pyplot as plt
+import numpy as np
+
+from src.mortgage.mortgage_utils.mortgage_kernels_util import njit
+
+
+_EQUITY_DELTAS = np.arange(-4, 5, dtype=np.int64) * 100_000
+
+
+@njit('float64(float64, float64, float64)', cache=True)
+def _max_price_kernel(max_ltv: float, equity: float, max_loan: float) -> float:
+    """
+    Cap-aware maximum purchase price for a given equity and LTV limit.
+
+    Kept as a typed free function so Numba compiles it ahead of the
+    sensitivity sweeps that call it per point.
+
+    :param max_ltv: The binding loan-to-value limit as a fraction.
+    :param equity: The equity available for the purchase.
+    :param max_loan: The maximum loan amount the lenders allow.
+
+    :return: The maximum affordable property price.
+    """
+    price = equity / (1.0 - max_ltv)
+    if price - equity > max_loan:
+        return equity + max_loan
+    return price
+
 
 class RealEstateInvestorsPortfolio:
     def __init__(self, *real_estate_investor: RealEstateInvestor):
@@ -10,6 +36,74 @@ class RealEstateInvestorsPortfolio:
         self.investors = list(real_estate_investor)
         self.num_borrowers = (len(self.investors))
 
+        # Struct-of-arrays repack of the per-investor figures, so the aggregate
+        # calculate_* methods below reduce over contiguous float64 buffers
+        # instead of re-walking the investor objects on every call.
+        self._disposable = np.fromiter((investor.disposable_income for investor in self.investors),
+                                       dtype=np.float64, count=self.num_borrowers)
+        self._debt = np.fromiter((investor.total_debt_payment for investor in self.investors),
+                                 dtype=np.float64, count=self.num_borrowers)
+        self._net_income = np.fromiter((investor.net_monthly_income for investor in self.investors),
+                                       dtype=np.float64, count=self.num_borrowers)
+        self._equity = np.fromiter((investor.total_available_equity for investor in self.investors),
+                                   dtype=np.float64, count=self.num_borrowers)
+        self._gross_rent = np.fromiter((investor.gross_rental_income for investor in self.investors),
+                                       dtype=np.float64, count=self.num_borrowers)
+        self._max_monthly_repay = np.fromiter(
+            (investor.calculate_maximum_monthly_loan_repayment() for investor in self.investors),
+            dtype=np.float64, count=self.num_borrowers)
+        self._ltvs = LTV_BY_TYPE[np.fromiter((investor.type_id for investor in self.investors),
+                                              dtype=np.intp, count=self.num_borrowers)]
+        self._min_ltv = float(self._ltvs.min()) if self.investors else 0.0
+        self._cached_max_loan = None
+        if self.num_borrowers == 1:
+            self._install_single_investor_fast_path()
+
+    _SINGLE_INVESTOR_FAST_PATH = ('calculate_total_disposable_income',
+                                  'calculate_monthly_total_debt_payment',
+                                  'calculate_monthly_total_net_income',
+                                  'calculate_maximum_monthly_loan_repayment',
+                                  'calculate_total_available_equity',
+                                  'get_gross_rental_income')
+
+    def _install_single_investor_fast_path(self) -> None:
+        """
+        Shadow the aggregate methods with direct attribute reads for the common
+        single-investor portfolio, skipping the array reductions entirely.
+        """
+        investor = self.investors[0]
+        self.calculate_total_disposable_income = lambda: investor.disposable_income
+        self.calculate_monthly_total_debt_payment = lambda: investor.total_debt_payment
+        self.calculate_monthly_total_net_income = lambda: investor.net_monthly_income
+        self.calculate_maximum_monthly_loan_repayment = lambda: investor.max_monthly_repay
+        self.calculate_total_available_equity = lambda: investor.total_available_equity
+        self.get_gross_rental_income = lambda: investor.gross_rental_income
+
+    def add_investor(self, investor: RealEstateInvestor) -> None:
+        """
+        Add an investor to the portfolio, keeping the cached aggregates in sync.
+
+        :param investor: The investor to add.
+        """
+        self.investors.append(investor)
+        self.num_borrowers += 1
+        self._disposable = np.append(self._disposable, investor.disposable_income)
+        self._debt = np.append(self._debt, investor.total_debt_payment)
+        self._net_income = np.append(self._net_income, investor.net_monthly_income)
+        self._equity = np.append(self._equity, investor.total_available_equity)
+        self._gross_rent = np.append(self._gross_rent, investor.gross_rental_income)
+        self._max_monthly_repay = np.append(self._max_monthly_repay,
+                                            investor.calculate_maximum_monthly_loan_repayment())
+        self._ltvs = np.append(self._ltvs, LTV_BY_TYPE[investor.type_id])
+        self._min_ltv = float(self._ltvs.min())
+        self._cached_max_loan = None
+        if self.num_borrowers > 1:
+            # Fall back to the array reductions once the portfolio grows.
+            for name in self._SINGLE_INVESTOR_FAST_PATH:
+                self.__dict__.pop(name, None)
+        if self.num_borrowers == 1:
+            self._install_single_investor_fast_path()
+
     def calculate_total_disposable_income(self) -> int:
         """
         Calculate the total disposable income across all investors in the portfolio.
@@ -17,7 +111,7 @@ class RealEstateInvestorsPortfolio:
         :return: The calculated total disposable income.
         :rtype: int
         """
-        return sum([investor.disposable_income for investor in self.investors])
+        return int(self._disposable.sum())
 
     def calculate_monthly_total_debt_payment(self) -> int:
         """
@@ -26,7 +120,7 @@ class RealEstateInvestorsPortfolio:
         :return: The calculated total monthly debt payments.
         :rtype: int
         """
-        return sum([investor.total_debt_payment for investor in self.investors])
+        return int(self._debt.sum())
 
     def calculate_annual_total_debt_payment(self) -> int:
         """
@@ -44,7 +138,7 @@ class RealEstateInvestorsPortfolio:
         :return: The calculated total monthly net income.
         :rtype: int
         """
-        return sum([investor.net_monthly_income for investor in self.investors])
+        return int(self._net_income.sum())
 
     def calculate_annual_total_net_income(self) -> int:
         """
@@ -62,7 +156,7 @@ class RealEstateInvestorsPortfolio:
         :return: The calculated total maximum monthly loan repayment.
         :rtype: int
         """
-        return sum([investor.calculate_maximum_monthly_loan_repayment() for investor in self.investors])
+        return int(self._max_monthly_repay.sum())
 
     def calculate_total_available_equity(self) -> int:
         """
@@ -71,7 +165,7 @@ class RealEstateInvestorsPortfolio:
         :return: The calculated total available equity.
         :rtype: int
         """
-        return sum([investor.total_available_equity for investor in self.investors])
+        return int(self._equity.sum())
 
     def calculate_maximum_loan_amount(self, monthly_payment: Optional[int] = None, num_payments: int = 360) -> int:
         """
@@ -84,9 +178,13 @@ class RealEstateInvestorsPortfolio:
         :return: The calculated maximum loan amount.
         :rtype: int
         """
-        if monthly_payment is None:
-            monthly_payment = self.calculate_maximum_monthly_loan_repayment()
         maximum_monthly_loan_repayment = self.calculate_maximum_monthly_loan_repayment()
+        if monthly_payment is None:
+            # The all-defaults call dominates the plot sweeps; cache its PV math.
+            if self._cached_max_loan is None:
+                self._cached_max_loan = calculate_maximum_loan_amount(num_payments,
+                                                                      maximum_monthly_loan_repayment)
+            return self._cached_max_loan
         if monthly_payment > maximum_monthly_loan_repayment:
             assert False, f"Monthly payment '{monthly_payment}' exceeds the maximum allowable monthly loan repayment '{maximum_monthly_loan_repayment}'."
         return calculate_maximum_loan_amount(num_payments, monthly_payment)
@@ -116,7 +214,7 @@ class RealEstateInvestorsPortfolio:
         :return: The calculated total gross rental income.
         :rtype: int
         """
-        return sum([investor.gross_rental_income for investor in self.investors])
+        return int(self._gross_rent.sum())
 
     def calculate_maximum_property_price(self) -> int:
         """
@@ -126,37 +224,37 @@ class RealEstateInvestorsPortfolio:
         :rtype: int
         """
         # TODO: check how multiple ppl take loans works
-        max_possible_ltv = min([investor.real_estate_investment_type.value for investor in self.investors])
+        max_possible_ltv = self._min_ltv
         total_available_equity = self.calculate_total_available_equity()
-        maximum_property_price = total_available_equity / (1 - max_possible_ltv)
-        loan_needed = maximum_property_price - total_available_equity
-        if loan_needed > self.calculate_maximum_loan_amount():
-            maximum_property_price = total_available_equity + self.calculate_maximum_loan_amount()
-        return maximum_property_price
+        return self.calculate_max_price(max_possible_ltv, total_available_equity,
+                                        self.calculate_maximum_loan_amount())
 
     def plot_maximum_property_price_vs_total_available_equity(self) -> None:
-        max_possible_ltv = min([investor.real_estate_investment_type.value for investor in self.investors])
+        import matplotlib.pyplot as plt
+
+        max_possible_ltv = self._min_ltv
         total_available_equity = self.calculate_total_available_equity()
-        total_available_equities =  [total_available_equity + i * 100_000 for i in range(-4, 5)]
-        y_s =[self.calculate_max_price(max_possible_ltv, equity) for equity in total_available_equities]
+        max_loan = self.calculate_maximum_loan_amount()
+        total_available_equities = total_available_equity + _EQUITY_DELTAS
+        prices = total_available_equities / (1 - max_possible_ltv)
+        loans_needed = prices - total_available_equities
+        y_s = np.where(loans_needed > max_loan, total_available_equities + max_loan, prices)
 
         plt.plot(total_available_equities, y_s)
         plt.xlabel('Equity Available')
         plt.ylabel('Maximum Purchase Price')
         plt.title('Maximum Purchase Price vs Equity Available')
 
-        for x, y in zip(total_available_equities, y_s):
-            plt.text(x, y, f'({x/1_000_000:.2f}M, {y/1_000_000:.2f}M)', ha='left', va='bottom')
+        x_m = (total_available_equities / 1e6).tolist()
+        y_m = (y_s / 1e6).tolist()
+        for x, y, xm, ym in zip(total_available_equities.tolist(), y_s.tolist(), x_m, y_m):
+            plt.text(x, y, f'({xm:.2f}M, {ym:.2f}M)', ha='left', va='bottom')
 
         plt.legend()
         plt.show()
 
-    def calculate_max_price(self, max_possible_ltv, total_available_equity):
-        maximum_property_price = total_available_equity / (1 - max_possible_ltv)
-        loan_needed = maximum_property_price - total_available_equity
-        if loan_needed > self.calculate_maximum_loan_amount():
-            maximum_property_price = total_available_equity + self.calculate_maximum_loan_amount()
-        return maximum_property_price
+    def calculate_max_price(self, max_possible_ltv, total_available_equity, max_loan):
+        return _max_price_kernel(float(max_possible_ltv), float(total_available_equity), float(max_loan))
 
 
 
@@ -19,9 +19,13 @@ class FindMortgage():
             mortgage_amount = round(property_value * loan_to_value)
         if loan_to_value is None:
             loan_to_value = round(mortgage_amount / property_value, 2)
-        if property_value > real_estate_investors_portfolio.calculate_maximum_property_price():
+        # The arithmetic-only checks above short-circuit before the portfolio
+        # limits are solved; each limit is then fetched exactly once.
+        max_property_price = real_estate_investors_portfolio.calculate_maximum_property_price()
+        max_loan_amount = real_estate_investors_portfolio.calculate_maximum_loan_amount()
+        if property_value > max_property_price:
             raise ValueError(
                 "Property value exceeds the maximum allowed value. Please adjust the property value accordingly.")
-        if mortgage_amount > real_estate_investors_portfolio.calculate_maximum_loan_amount():
+        if mortgage_amount > max_loan_amount:
             raise ValueError(
                 "Mortgage amount exceeds the maximum allowed loan amount. Please adjust the mortgage amount accordingly.")
@@ -22,8 +22,15 @@ class InterestType(Enum):
 
     - Prime: Interest rates linked to the prime rate.
     """
-    Constant = {ConstantLinked, ConstantNotLinked}
-    NotConstant = {Eligibility, ChangeLinked, ChangeNotLinked}
-    Prime = {Prime}
+    Constant = frozenset({ConstantLinked, ConstantNotLinked})
+    NotConstant = frozenset({Eligibility, ChangeLinked, ChangeNotLinked})
+    Prime = frozenset({Prime})
+
+
+# Reverse map for O(1) classification of a track class, avoiding per-check
+# membership scans over the enum values.
+TRACK_TO_INTEREST = {track_class: interest_type
+                     for interest_type in InterestType
+                     for track_class in interest_type.value}
 
 
@@ -22,6 +22,13 @@ class LinkageType(Enum):
 
     - Prime: Loans with interest rates linked to the prime rate.
     """
-    Linked = {ChangeLinked, ConstantLinked, Eligibility}
-    NotLinked = {ChangeNotLinked, ConstantNotLinked}
-    Prime = {Prime}
+    Linked = frozenset({ChangeLinked, ConstantLinked, Eligibility})
+    NotLinked = frozenset({ChangeNotLinked, ConstantNotLinked})
+    Prime = frozenset({Prime})
+
+
+# Reverse map for O(1) classification of a track class, avoiding per-check
+# membership scans over the enum values.
+TRACK_TO_LINKAGE = {track_class: linkage_type
+                    for linkage_type in LinkageType
+                    for track_class in linkage_type.value}
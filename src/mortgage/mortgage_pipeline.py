@@ -1,18 +1,37 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
-from src.mortgage.mortgage_enums.interest_type import InterestType
+from src.mortgage.mortgage_enums.interest_type import InterestType, TRACK_TO_INTEREST
 from src.mortgage.mortgage_tracks.mortgage_track import MortgageTrack
-from itertools import zip_longest
-import numpy_financial as npf
-import matplotlib
 from src.mortgage.mortgage_tracks.eligibility import Eligibility
-from src.mortgage.mortgage_utils.mortgage_financial_utils_il import calculate_discount_factor
+from src.mortgage.mortgage_utils.mortgage_financial_utils_il import calculate_discount_factor, \
+    internal_rate_of_return
 from typing import List, Dict, Optional
-from src.mortgage.mortgage_enums.linkage_type import LinkageType
+from src.mortgage.mortgage_enums.linkage_type import LinkageType, TRACK_TO_LINKAGE
 from src.mortgage.mortgage_utils.mortgage_plotter_util import *
 from src.mortgage.mortgage_utils.mortgage_printer_util import plot_mortgage_monthly_payments
 
-matplotlib.use('TkAgg')
+ScheduleSnapshot = namedtuple("ScheduleSnapshot",
+                              ["principal_payments", "interest_payments",
+                               "monthly_payments", "remain_balances"])
+
+
+def _sum_padded(payment_lists: List[List[float]]) -> np.ndarray:
+    """
+    Sum per-track schedules element-wise, zero-padding shorter tracks.
+
+    One C-level reduction over a padded 2D stack replaces the per-element
+    zip_longest/sum pairs in the pipeline aggregators.
+
+    :param payment_lists: One schedule list per track.
+    :return: The padded element-wise sums as a float64 array.
+    """
+    stacked = np.zeros((len(payment_lists), max(map(len, payment_lists))))
+    for row, payments in enumerate(payment_lists):
+        stacked[row, :len(payments)] = payments
+    return stacked.sum(axis=0)
 
 
 class MortgagePipeline:
@@ -48,7 +67,20 @@ class MortgagePipeline:
         :type mortgage_tracks: MortgageTrack
         """
         self.tracks = list(mortgage_tracks)
-        self.total_initial_loan_amount = sum([track.initial_loan_amount for track in self.tracks])
+        self.total_initial_loan_amount = sum(track.initial_loan_amount for track in self.tracks)
+        self._has_eligibility = any(isinstance(track, Eligibility) for track in self.tracks)
+        self._snapshot_cache = None
+        self._snapshot_sources = []
+
+    def _loan_amounts(self) -> np.ndarray:
+        """
+        The per-track initial loan amounts as a float64 array.
+
+        Rebuilt per call because the sensitivity sweeps mutate track amounts
+        behind the pipeline's back; the dot products over it stay the win.
+        """
+        return np.fromiter((track.initial_loan_amount for track in self.tracks),
+                           dtype=np.float64, count=len(self.tracks))
 
     def calculate_total_interest_payment(self) -> int:
         """
@@ -56,7 +88,7 @@ class MortgagePipeline:
 
         :return: The calculated total interest payments.
         """
-        return sum(self.get_interest_payments())
+        return self.get_interest_payments().sum()
 
     def calculate_linked_index_payment(self) -> int:
         """
@@ -66,6 +98,16 @@ class MortgagePipeline:
         """
         return self.get_total_payment() - self.calculate_total_interest_payment() - self.total_initial_loan_amount
 
+    @property
+    def tracks_percentages(self) -> Dict[MortgageTrack, float]:
+        """
+        A dictionary with mortgage tracks as keys and their corresponding percentages of the
+        total loan amount. Computed per access — the sweeps mutate track
+        amounts behind the pipeline's back, so the numerators must stay fresh.
+        """
+        return {track: track.initial_loan_amount / self.total_initial_loan_amount
+                for track in self.tracks}
+
     def get_tracks_percentages_dic(self) -> Dict[MortgageTrack, float]:
         """
         Get a dictionary with mortgage tracks as keys and their corresponding percentages of the total loan amount.
@@ -73,20 +115,33 @@ class MortgagePipeline:
         :return: A dictionary with mortgage tracks as keys and their percentages.
         :rtype: Dict[MortgageTrack, float (between 0 and 1)]
         """
-        tracks_percentages = [track.initial_loan_amount / self.total_initial_loan_amount for track in self.tracks]
-        return {track: percentage for track, percentage in zip(self.tracks, tracks_percentages)}
+        return self.tracks_percentages
+
+    def _warm_payment_caches(self) -> None:
+        """
+        Fill cold track amortization caches in parallel.
+
+        Each track's schedule is independent and the kernel is compiled with
+        ``nogil=True``, so with Numba installed a short-lived thread pool warms
+        multi-track pipelines concurrently. Under the pure-Python fallback the
+        threads serialize on the GIL and this degrades to the sequential cost;
+        warm tracks make it a no-op either way.
+        """
+        cold_tracks = [track for track in self.tracks if track._payments_cache is None]
+        if len(cold_tracks) > 1:
+            with ThreadPoolExecutor(max_workers=len(cold_tracks)) as executor:
+                list(executor.map(lambda track: track._calculate_payments(), cold_tracks))
 
-    def get_principal_payments(self) -> List[float]:
+    def get_principal_payments(self) -> np.ndarray:
         """
         Get a list of principal payments, where each element represents the sum of principal payments across all tracks
         for a monthly time period.
 
-        :return: A list of principal payments.
-        :rtype: List[float]
+        :return: The principal payments as a float64 array.
+        :rtype: np.ndarray
         """
-        principal_payments_list = [track.get_principal_payments() for track in self.tracks]
-        # Pad the lists with zeros and perform element-wise addition
-        return [sum(x) for x in zip_longest(*principal_payments_list, fillvalue=0)]
+        self._warm_payment_caches()
+        return _sum_padded([track._calculate_payments()[0] for track in self.tracks])
 
     def get_annual_principal_payments(self) -> List[float]:
         """
@@ -96,19 +151,20 @@ class MortgagePipeline:
         :return: A list of principal payments.
         :rtype: List[float]
         """
-        return list(np.array(self.get_principal_payments()).reshape(-1, 12).sum(axis=1))
+        self._warm_payment_caches()
+        monthly = _sum_padded([track._calculate_payments()[0] for track in self.tracks])
+        return monthly.reshape(-1, 12).sum(axis=1).tolist()
 
-    def get_interest_payments(self) -> List[float]:
+    def get_interest_payments(self) -> np.ndarray:
         """
         Get a list of interest payments, where each element represents the sum of interest payments across all tracks
         for a monthly time period.
 
-        :return: A list of interest payments.
-        :rtype: List[float]
+        :return: The interest payments as a float64 array.
+        :rtype: np.ndarray
         """
-        interest_payments_list = [track.get_interest_payments() for track in self.tracks]
-        # Pad the lists with zeros and perform element-wise addition
-        return [sum(x) for x in zip_longest(*interest_payments_list, fillvalue=0)]
+        self._warm_payment_caches()
+        return _sum_padded([track._calculate_payments()[1] for track in self.tracks])
 
     def get_annual_interest_payments(self) -> List[float]:
         """
@@ -118,19 +174,21 @@ class MortgagePipeline:
         :return: A list of interest payments.
         :rtype: List[float]
         """
-        return list(np.array(self.get_interest_payments()).reshape(-1, 12).sum(axis=1))
+        self._warm_payment_caches()
+        monthly = _sum_padded([track._calculate_payments()[1] for track in self.tracks])
+        return monthly.reshape(-1, 12).sum(axis=1).tolist()
 
-    def get_monthly_payments(self) -> List[int]:
+    def get_monthly_payments(self) -> np.ndarray:
         """
         Get a list of monthly payments, where each element represents the sum of monthly payments across all tracks
         for a specific time period.
 
-        :return: A list of monthly payments.
-        :rtype: List[float]
+        :return: The rounded monthly payments as an int64 array.
+        :rtype: np.ndarray
         """
-        monthly_payments_list = [track.get_monthly_payments() for track in self.tracks]
-        # Pad the lists with zeros and perform element-wise addition
-        return [round(sum(x)) for x in zip_longest(*monthly_payments_list, fillvalue=0)]
+        self._warm_payment_caches()
+        monthly_payments = _sum_padded([track._calculate_payments()[2] for track in self.tracks])
+        return np.rint(monthly_payments).astype(np.int64)
 
     def get_annual_payments(self) -> List[int]:
         """
@@ -140,19 +198,20 @@ class MortgagePipeline:
         :return: A list of monthly payments.
         :rtype: List[float]
         """
-        return list(np.array(self.get_monthly_payments()).reshape(-1, 12).sum(axis=1))
+        self._warm_payment_caches()
+        monthly = np.rint(_sum_padded([track._calculate_payments()[2] for track in self.tracks]))
+        return monthly.reshape(-1, 12).sum(axis=1).astype(np.int64).tolist()
 
-    def get_remain_balances(self) -> List[int]:
+    def get_remain_balances(self) -> np.ndarray:
         """
         Get a list of remaining balances, where each element represents the sum of remaining balances across all tracks
         for a month time period.
 
-        :return: A list of remaining balances.
-        :rtype: List[float]
+        :return: The remaining balances as a float64 array.
+        :rtype: np.ndarray
         """
-        remain_balances_list = [track.get_remaining_balances() for track in self.tracks]
-        # Pad the lists with zeros and perform element-wise addition
-        return [sum(x) for x in zip_longest(*remain_balances_list, fillvalue=0)]
+        self._warm_payment_caches()
+        return _sum_padded([track._calculate_payments()[3] for track in self.tracks])
 
     def get_annual_remain_balances(self) -> List[int]:
         """
@@ -162,7 +221,24 @@ class MortgagePipeline:
         :return: A list of remaining balances.
         :rtype: List[float]
         """
-        return [balance for i, balance in enumerate(self.get_remain_balances()) if i % 12 == 0]
+        self._warm_payment_caches()
+        return _sum_padded([track._calculate_payments()[3] for track in self.tracks])[::12].tolist()
+
+    def get_remain_balance_at(self, month: int) -> float:
+        """
+        Get the total remaining balance across all tracks at a single month.
+
+        Avoids building the full padded balance schedule when only one point is needed.
+
+        :param month: Zero-based month index into the schedule.
+        :return: The summed remaining balance at that month; tracks already repaid contribute 0.
+        """
+        total_balance = 0
+        for track in self.tracks:
+            remaining_balances = track._calculate_payments()[3]
+            if month < len(remaining_balances):
+                total_balance += remaining_balances[month]
+        return total_balance
 
     def get_total_payment(self, months_to_exit: Optional[int] = None) -> int:
         """
@@ -172,8 +248,8 @@ class MortgagePipeline:
         :rtype: float
         """
         if months_to_exit is None:
-            return sum([track.calculate_total_repayment() for track in self.tracks])
-        return sum(self.get_monthly_payments()[:months_to_exit])
+            return sum(track.calculate_total_repayment() for track in self.tracks)
+        return self.get_monthly_payments()[:months_to_exit].sum()
 
     def calculate_highest_monthly_payment(self) -> int:
         """
@@ -182,7 +258,7 @@ class MortgagePipeline:
         :return: The highest monthly payment.
         :rtype: float
         """
-        return max(self.get_monthly_payments())
+        return self.get_monthly_payments().max()
 
     def calculate_initial_monthly_payment(self) -> int:
         """
@@ -191,7 +267,7 @@ class MortgagePipeline:
         :return: The initial monthly payment.
         :rtype: float
         """
-        return np.ceil(sum([track.calculate_initial_monthly_payment() for track in self.tracks]))
+        return np.ceil(sum(track.calculate_initial_monthly_payment() for track in self.tracks))
 
     def calculate_loan_yearly_irr(self, months_to_exit: int = 360) -> float:
         """
@@ -200,8 +276,10 @@ class MortgagePipeline:
         :return: The yearly IRR for the mortgage.
         :rtype: float (percentage)
         """
-        monthly_cash_flow = [-self.total_initial_loan_amount] + self.get_monthly_payments()[:months_to_exit]
-        return npf.irr(monthly_cash_flow) * 12 * 100 * -1
+        monthly_cash_flow = np.concatenate(([-self.total_initial_loan_amount],
+                                            self.get_monthly_payments()[:months_to_exit]))
+        monthly_irr = internal_rate_of_return(monthly_cash_flow, self.calculate_weighted_average_interest_rates() / 12)
+        return monthly_irr * 12 * 100 * -1
 
     def get_num_of_payments(self) -> int:
         """
@@ -212,15 +290,37 @@ class MortgagePipeline:
         """
         return max([track.num_payments for track in self.tracks])
 
+    @property
+    def _snapshot(self) -> ScheduleSnapshot:
+        """
+        The four padded monthly schedules bundled together, so a report that
+        prints and plots everything aggregates the tracks a single time.
+
+        The bundle is tied to the per-track amortization caches it was built
+        from: mutating a track's inputs clears that track's cache (see
+        MortgageTrack.__setattr__), which is detected here and triggers a
+        rebuild instead of serving stale schedules.
+        """
+        sources = [track._payments_cache for track in self.tracks]
+        if (self._snapshot_cache is None
+                or any(source is None or source is not recorded
+                       for source, recorded in zip(sources, self._snapshot_sources))):
+            self._snapshot_cache = ScheduleSnapshot(self.get_principal_payments(), self.get_interest_payments(),
+                                                    self.get_monthly_payments(), self.get_remain_balances())
+            # The getters above warmed every track cache; record the tuples the
+            # bundle was built from for the staleness check.
+            self._snapshot_sources = [track._payments_cache for track in self.tracks]
+        return self._snapshot_cache
+
     def print_payments(self):
         """
 
         :return:
         """
         plot_mortgage_monthly_payments(self.get_num_of_payments(),
-                                       self.get_principal_payments(),
-                                       self.get_interest_payments(),
-                                       self.get_remain_balances())
+                                       self._snapshot.principal_payments,
+                                       self._snapshot.interest_payments,
+                                       self._snapshot.remain_balances)
 
     def total_loan_cost(self) -> float:
         """
@@ -229,7 +329,10 @@ class MortgagePipeline:
         :return: The total loan cost.
         :rtype: float
         """
-        return sum([track.loan_cost() * percentage for track, percentage in self.get_tracks_percentages_dic().items()])
+        costs = np.fromiter((track.loan_cost() for track in self.tracks),
+                            dtype=np.float64, count=len(self.tracks))
+        amounts = self._loan_amounts()
+        return float(costs @ amounts / amounts.sum())
 
     def get_tracks_loan_cost(self) -> Dict[MortgageTrack, float]:
         """
@@ -247,7 +350,10 @@ class MortgagePipeline:
         :return: The weighted average interest rate.
         :rtype: float
         """
-        return sum([track.interest_rate * percentage for track, percentage in self.get_tracks_percentages_dic().items()])
+        rates = np.fromiter((track.interest_rate for track in self.tracks),
+                            dtype=np.float64, count=len(self.tracks))
+        amounts = self._loan_amounts()
+        return float(rates @ amounts / amounts.sum())
 
     def plot_interest_and_principal_payments(self) -> None:
         """
@@ -257,7 +363,8 @@ class MortgagePipeline:
 
         :return: None
         """
-        plot_principal_and_interest_payments(self.get_num_of_payments(), self.get_principal_payments(), self.get_interest_payments())
+        plot_principal_and_interest_payments(self.get_num_of_payments(), self._snapshot.principal_payments,
+                                             self._snapshot.interest_payments)
 
     def plot_monthly_payments(self) -> None:
         """
@@ -267,10 +374,10 @@ class MortgagePipeline:
 
         :return: None
         """
-        plot_monthly_payments(self.get_num_of_payments(), self.get_monthly_payments())
+        plot_monthly_payments(self.get_num_of_payments(), self._snapshot.monthly_payments)
 
     def plot_remain_balances(self) -> None:
-        plot_remain_balances(self.get_remain_balances())
+        plot_remain_balances(self._snapshot.remain_balances)
 
     def calculate_early_payment_fee(self, num_of_months: int, average_interest_in_early_payment: Optional[Dict[MortgageTrack.__class__, float]] = None) -> int:
         """
@@ -286,9 +393,8 @@ class MortgagePipeline:
             average_interest_in_early_payment = {track.__class__: track.interest_rate for track in self.tracks}
         #TODO : test this
         full_early_payment_fee = sum(track.calculate_early_payment_fee(num_of_months, average_interest_in_early_payment[track.__class__]) for track in self.tracks)
-        eligibility_present = any(isinstance(track, Eligibility) for track in self.tracks)
 
-        discount_factor = calculate_discount_factor(num_of_months, eligibility_present)
+        discount_factor = calculate_discount_factor(num_of_months, self._has_eligibility)
         return round(discount_factor * full_early_payment_fee)
 
     def calculate_normalize_resource_allocation(self) -> Dict[MortgageTrack, float]:
@@ -300,7 +406,9 @@ class MortgagePipeline:
             portion of the monthly payment allocated for the specific track. The normalization is calculated by
             dividing each track's initial monthly payment by the total initial monthly payment across all tracks.
         """
-        return {track: track.calculate_initial_monthly_payment() / self.calculate_initial_monthly_payment() for track in self.tracks}
+        per_track = {track: track.calculate_initial_monthly_payment() for track in self.tracks}
+        total_payment = np.ceil(sum(per_track.values()))
+        return {track: payment / total_payment for track, payment in per_track.items()}
 
     def calculate_index_linkage_segmentation(self) -> Dict[LinkageType, float]:
         """
@@ -310,10 +418,10 @@ class MortgagePipeline:
             corresponding to tracks associated with each linkage type.
         :rtype: Dict[LinkageType, float]
         """
-        #TODO
-        return {LinkageType.Linked: sum([percentage for track, percentage in self.get_tracks_percentages_dic().items() if track in LinkageType.Linked.value]),
-                LinkageType.NotLinked: sum([percentage for track, percentage in self.get_tracks_percentages_dic().items() if track in LinkageType.NotLinked.value]),
-                LinkageType.Prime: sum([percentage for track, percentage in self.get_tracks_percentages_dic().items() if track in LinkageType.Prime.value])}
+        segmentation = {linkage_type: 0.0 for linkage_type in LinkageType}
+        for track, percentage in self.tracks_percentages.items():
+            segmentation[TRACK_TO_LINKAGE[type(track)]] += percentage
+        return segmentation
 
     def calculate_interest_type_segmentation(self) -> Dict[InterestType, float]:
         """
@@ -324,17 +432,10 @@ class MortgagePipeline:
         :rtype: Dict[InterestType, float]
         """
 
-        # sum_i = 0
-        # for track, percentage in self.get_tracks_percentages_dic().items():
-        #     for my_class in  InterestType.Constant.value:
-        #         from src.mortgage_tracks.constant_not_linked import ConstantNotLinked
-        #         from src.mortgage_tracks.constant_not_linked import ConstantNotLinked
-        #         if isinstance(track, my_class):
-        #             sum_i +=  percentage
-        # TODO
-        return {InterestType.Constant: sum([percentage for track, percentage in self.get_tracks_percentages_dic().items() if any(isinstance(track, class_type) for class_type in InterestType.Constant.value)]),
-                InterestType.NotConstant: sum([percentage for track, percentage in self.get_tracks_percentages_dic().items() if any(isinstance(track, class_type) for class_type in InterestType.NotConstant.value)]),
-                InterestType.Prime: sum([percentage for track, percentage in self.get_tracks_percentages_dic().items() if track in any(isinstance(track, class_type) for class_type in InterestType.Prime.value)])}
+        segmentation = {interest_type: 0.0 for interest_type in InterestType}
+        for track, percentage in self.tracks_percentages.items():
+            segmentation[TRACK_TO_INTEREST[type(track)]] += percentage
+        return segmentation
 
     def calculate_total_cost_of_borrowing(self, years_to_exit: Optional[int] = None, average_interest_in_early_payment: Optional[Dict[MortgageTrack, float]] = None) -> int:
         """
@@ -348,5 +449,5 @@ class MortgagePipeline:
             return round(self.get_total_payment() - self.total_initial_loan_amount)
         else:
             months_to_exit = 12 * years_to_exit
-            return round(sum(self.get_interest_payments()[:months_to_exit]) + self.calculate_early_payment_fee(months_to_exit, average_interest_in_early_payment))
+            return round(self.get_interest_payments()[:months_to_exit].sum() + self.calculate_early_payment_fee(months_to_exit, average_interest_in_early_payment))
 
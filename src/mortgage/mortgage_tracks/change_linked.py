@@ -1,3 +1,5 @@
+import numpy as np
+
 from src.mortgage.mortgage_tracks.mortgage_track import MortgageTrack
 from src.mortgage.mortgage_utils.mortgage_financial_utils_il import calculate_early_payment_fee
 from typing import List, Optional
@@ -19,6 +21,7 @@ class ChangeLinked(MortgageTrack):
         :param average_interest_in_early_payment: Average interest rate during early payment.
         :return: The calculated early payment fee.
         """
-        monthly_payments_without_linking = [self.calculate_initial_monthly_payment() for _ in range(self.num_payments)]
+        initial_monthly_payment = self.calculate_initial_monthly_payment()
+        monthly_payments_without_linking = np.full(self.num_payments, initial_monthly_payment)
         return calculate_early_payment_fee(average_interest_in_early_payment, monthly_payments_without_linking[num_of_months:],
                                            self.interest_rate, self.average_interest_when_taken, self.interest_changing_period)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from src.mortgage.mortgage_tracks.mortgage_track import MortgageTrack
 from src.mortgage.mortgage_utils.mortgage_financial_utils_il import calculate_early_payment_fee
 from typing import Optional, List
@@ -17,6 +19,7 @@ class ConstantLinked(MortgageTrack):
         """
         if num_of_months < 0 or average_interest_in_early_payment < 0:
             raise ValueError(f"Function arguments must be non-negative: number of months: {num_of_months}, average interest in early payment: {average_interest_in_early_payment}")
-        monthly_payments_without_linking = [self.calculate_initial_monthly_payment() for _ in range(self.num_payments)]
+        initial_monthly_payment = self.calculate_initial_monthly_payment()
+        monthly_payments_without_linking = np.full(self.num_payments, initial_monthly_payment)
         return calculate_early_payment_fee(average_interest_in_early_payment, monthly_payments_without_linking[num_of_months:],
                                            self.interest_rate, self.average_interest_when_taken, -1)
@@ -20,7 +20,7 @@ class ConstantNotLinked(MortgageTrack):
             raise ValueError(
                 f"Function arguments must be non-negative: number of months: {num_of_months}, average interest in early payment: {average_interest_in_early_payment}")
         return calculate_early_payment_fee(average_interest_in_early_payment,
-                                           self.get_monthly_payments()[num_of_months:],
+                                           self._calculate_payments()[2][num_of_months:],
                                            self.interest_rate, self.average_interest_when_taken, -1)
 
 
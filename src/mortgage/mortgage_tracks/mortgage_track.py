@@ -1,34 +1,50 @@
 from abc import ABC, abstractmethod
-import numpy_financial as npf
-import matplotlib
+import numpy as np
+from src.mortgage.mortgage_utils.mortgage_kernels_util import amortize_track
+from src.mortgage.mortgage_utils.mortgage_financial_utils_il import internal_rate_of_return
 from src.mortgage.mortgage_utils.mortgage_plotter_util import plot_monthly_payments, \
     plot_principal_and_interest_payments, plot_remain_balances
 from src.mortgage.mortgage_utils.mortgage_printer_util import plot_mortgage_monthly_payments
 from typing import Optional, List, Tuple
 
-matplotlib.use('TkAgg')
 from src.mortgage.mortgage_constants import MortgageConstants
 
 
 class MortgageTrack(ABC):
 
+    # Assigning any of these attributes invalidates the cached amortization.
+    _AMORTIZATION_INPUTS = frozenset({"interest_rate", "num_payments", "initial_loan_amount",
+                                      "linked_index", "forecasting_interest_rate",
+                                      "interest_only_period"})
+
     def __init__(self, interest_rate: float, num_payments: int, initial_loan_amount: int, linked_index: Optional[List[float]] = None,
                  forecasting_interest_rate: Optional[List[float]] = None, average_interest_when_taken: Optional[float] = None, interest_only_period: int = 0):
+        self._payments_cache = None
         self.interest_rate = interest_rate
         self.num_payments = num_payments
         self.initial_loan_amount = initial_loan_amount
-        self.linked_index = linked_index if linked_index else [0.0] * 360
-        self.forecasting_interest_rate = forecasting_interest_rate if forecasting_interest_rate else [0.0] * 360
+        # Stored as float64 arrays so each amortization call feeds the njit
+        # kernel directly instead of re-promoting Python lists. Defaults are
+        # sized by the actual term rather than a hardcoded 360 months.
+        self.linked_index = np.asarray(linked_index, dtype=np.float64) if linked_index \
+            else np.zeros(num_payments)
+        self.forecasting_interest_rate = np.asarray(forecasting_interest_rate, dtype=np.float64) \
+            if forecasting_interest_rate else np.zeros(num_payments)
         self.average_interest_when_taken = average_interest_when_taken if average_interest_when_taken else interest_rate
         self.interest_only_period = interest_only_period
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in MortgageTrack._AMORTIZATION_INPUTS:
+            object.__setattr__(self, "_payments_cache", None)
+
     def get_principal_payments(self) -> List[int]:
         """
         Get the list of principal payments over the loan term.
 
         :return: A list of principal payments.
         """
-        return self._calculate_payments()[0]
+        return self._calculate_payments()[0].tolist()
 
     def get_interest_payments(self) -> List[int]:
         """
@@ -36,7 +52,7 @@ class MortgageTrack(ABC):
 
         :return: A list of interest payments.
         """
-        return self._calculate_payments()[1]
+        return self._calculate_payments()[1].tolist()
 
     def get_monthly_payments(self) -> List[int]:
         """
@@ -44,7 +60,7 @@ class MortgageTrack(ABC):
 
         :return: A list of monthly payments.
         """
-        return self._calculate_payments()[2]
+        return self._calculate_payments()[2].tolist()
 
     def get_remaining_balances(self) -> List[int]:
         """
@@ -52,7 +68,7 @@ class MortgageTrack(ABC):
 
         :return: A list of remaining balances.
         """
-        return self._calculate_payments()[3]
+        return self._calculate_payments()[3].tolist()
 
     def get_total_principal_paid(self) -> int:
         """
@@ -72,7 +88,13 @@ class MortgageTrack(ABC):
 
     def calculate_initial_monthly_payment(self) -> int:
         #TODO: Check how its work with the interest only period
-        return npf.pmt(self.interest_rate / MortgageConstants.MONTHS_IN_YEAR, self.num_payments, -self.initial_loan_amount)
+        monthly_rate = self.interest_rate / MortgageConstants.MONTHS_IN_YEAR
+        if monthly_rate == 0.0:
+            return self.initial_loan_amount / self.num_payments
+        # Inlined npf.pmt for scalars; the 0-d array pow keeps the
+        # integer-exponent pow path npf used, so the payment is bit-identical.
+        growth = float(np.asarray(1 + monthly_rate) ** np.asarray(self.num_payments))
+        return self.initial_loan_amount * growth / ((growth - 1) / monthly_rate)
 
     def calculate_loan_annual_irr(self) -> float:
         """
@@ -83,8 +105,10 @@ class MortgageTrack(ABC):
         :return: The calculated yearly IRR as a percentage.
         """
         # Yearly IRR = Month IRR * 12 Months * 100 (Percentage) * -1 (Bank Investment)
-        monthly_cash_flow = [-self.initial_loan_amount] + self.get_monthly_payments()
-        return npf.irr(monthly_cash_flow) * MortgageConstants.MONTHS_IN_YEAR * 100 * -1
+        monthly_cash_flow = np.concatenate(([-self.initial_loan_amount],
+                                            self._calculate_payments()[2]))
+        monthly_irr = internal_rate_of_return(monthly_cash_flow, self.interest_rate / MortgageConstants.MONTHS_IN_YEAR)
+        return monthly_irr * MortgageConstants.MONTHS_IN_YEAR * 100 * -1
 
     def plot_monthly_payments(self) -> None:
         """
@@ -109,61 +133,33 @@ class MortgageTrack(ABC):
     def plot_remain_balances(self) -> None:
         plot_remain_balances(self.get_remaining_balances())
 
-    def _calculate_payments(self) -> Tuple[List[int], List[int], List[int], List[int], int, int]:
+    def _calculate_payments(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int, int]:
         """
         Calculate principal, interest, monthly payments, and remaining balances over the loan term.
 
         This private method performs the calculation for principal and interest payments for each month of the loan term.
-
-        :return: A tuple containing lists of principal payments, interest payments, monthly payments, remaining balances, total principal paid, and total interest paid.
-        """
-        # Initialize variables
-        principal_payments, interest_payments, monthly_payments, remaining_balances = [], [], [], []
-        total_principal_paid, total_interest_paid = 0, 0
-
-        # Initial values for the first period
-        remaining_balance = self.initial_loan_amount
-        interest_rate = self.interest_rate
-
-        # Monthly interest rate
-        monthly_interest = interest_rate / MortgageConstants.MONTHS_IN_YEAR
-
-        # Calculate interest-only period
-        for i in range(self.interest_only_period):
-            interest_payment = round(remaining_balance * monthly_interest, 2)
-            principal_payment = 0
-            total_interest_paid += interest_payment
-            principal_payments.append(principal_payment)
-            interest_payments.append(interest_payment)
-            remaining_balances.append(remaining_balance)
-            monthly_payments.append(principal_payment + interest_payment)
-
-        # Calculate principal and interest payments for the remaining term
-        num_payments = self.num_payments - self.interest_only_period
-        for period in range(1, num_payments + 1):
-            # Update remaining balance and interest rate based on indices
-            remaining_balance = remaining_balance * (1 + self.linked_index[period - 1])
-            interest_rate = interest_rate * (1 + self.forecasting_interest_rate[period - 1])
-
-            # Calculate interest and principal payments for the current period
-            interest_payment = remaining_balance * interest_rate / 12
-            principal_payment = npf.pmt(interest_rate / 12, num_payments - (period - 1),
-                                        -remaining_balance) - interest_payment
-            remaining_balance -= principal_payment
-
-            # Update total payments
-            total_principal_paid += principal_payment
-            total_interest_paid += interest_payment
-
-            # Round values and append to lists
-            principal_payment, interest_payment, remaining_balance = round(principal_payment, 2), round(
-                interest_payment, 2), round(remaining_balance, 2)
-            principal_payments.append(principal_payment)
-            interest_payments.append(interest_payment)
-            remaining_balances.append(remaining_balance)
-            monthly_payments.append(principal_payment + interest_payment)
-
-        return principal_payments, interest_payments, monthly_payments, remaining_balances, total_principal_paid, total_interest_paid
+        The schedules are kept as float64 arrays; the public getters convert to lists.
+
+        :return: A tuple containing arrays of principal payments, interest payments, monthly payments, remaining balances, plus total principal paid and total interest paid.
+        """
+        if self._payments_cache is not None:
+            return self._payments_cache
+        principal_payments, interest_payments, remaining_balances, total_principal_paid, total_interest_paid = \
+            amortize_track(
+                float(self.initial_loan_amount),
+                float(self.interest_rate),
+                self.num_payments,
+                self.interest_only_period,
+                self.linked_index,
+                self.forecasting_interest_rate)
+        # The kernel only rounds the balance (it feeds back into the loop);
+        # the payment arrays are rounded here in one vectorized pass.
+        principal_payments = np.round(principal_payments, 2)
+        interest_payments = np.round(interest_payments, 2)
+        self._payments_cache = (principal_payments, interest_payments,
+                                principal_payments + interest_payments, remaining_balances,
+                                total_principal_paid, total_interest_paid)
+        return self._payments_cache
 
     def calculate_highest_monthly_payment(self) -> int:
         """
@@ -171,7 +167,7 @@ class MortgageTrack(ABC):
 
         :return: The highest monthly payment.
         """
-        return max(self.get_monthly_payments())
+        return self._calculate_payments()[2].max()
 
     def calculate_total_interest_payment(self) -> int:
         """
@@ -179,7 +175,7 @@ class MortgageTrack(ABC):
 
         :return: The total interest payments.
         """
-        return sum(self.get_interest_payments())
+        return self._calculate_payments()[1].sum()
 
     def calculate_linked_index_payment(self) -> int:
         """
@@ -203,7 +199,7 @@ class MortgageTrack(ABC):
 
         :return: The total repayment.
         """
-        return sum(self.get_monthly_payments())
+        return self._calculate_payments()[2].sum()
 
     def print_payments(self) -> None:
         """
@@ -1,7 +1,11 @@
+import math
+
 import numpy_financial as npf
 import numpy as np
 from typing import List, Union
 
+from src.mortgage.mortgage_utils.mortgage_kernels_util import njit
+
 
 def calculate_early_payment_fee(A: float, B: List[Union[int, float]], C: float, R: float, n: int) -> int:
     """
@@ -17,16 +21,124 @@ def calculate_early_payment_fee(A: float, B: List[Union[int, float]], C: float,
     # in this case only aa + cc
     if n < 0 or n > len(B):
         n = len(B)
-    B_n = B[:n]
-    B_N = B[n:]
+    # Accept both plain lists and ndarray views of the cached schedule; the
+    # slices below are then views rather than copies.
+    B = np.asarray(B, dtype=np.float64)
     C = min(C, R)
-    aa = npf.npv(A, [0.0] + B_n)
-    bb = (1 / np.power(1 + A, n)) * npf.npv(R, [0.0] + B_N)
-    cc = npf.npv(C, [0.0] + B_n)
-    dd = (1 / np.power(1 + C, n)) * npf.npv(R, [0.0] + B_N)
-    # print(cc + dd)
+    # The four NPVs reduce to two dot products: aa/cc discount the head at A/C,
+    # and bb/dd share one tail NPV at R, shifted back n periods at A/C. The
+    # discount series (1+r)**-k are written exp(-k*log1p(r)): one log per rate
+    # instead of one pow per period, and log1p keeps precision at small rates.
+    head, tail = B[:n], B[n:]
+    periods = np.arange(1, n + 1, dtype=np.float64)
+    aa = head @ np.exp(-periods * math.log1p(A))
+    cc = head @ np.exp(-periods * math.log1p(C))
+    tail_periods = np.arange(1, len(tail) + 1, dtype=np.float64)
+    tail_npv = tail @ np.exp(-tail_periods * math.log1p(R))
+    bb = math.exp(-n * math.log1p(A)) * tail_npv
+    dd = math.exp(-n * math.log1p(C)) * tail_npv
     return round(aa + bb - (cc + dd))
-    # return aa + bb - (cc + dd)
+
+
+def calculate_early_payment_fees(A: np.ndarray, B: Union[List[float], np.ndarray], C: float,
+                                 R: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """
+    Batched companion of :func:`calculate_early_payment_fee` for refinancing
+    grids that score many (A, R, n) scenarios against one payment schedule.
+
+    Discounted prefix sums of B are built once per distinct rate, after which
+    every scenario is an O(1) lookup instead of its own NPV passes.
+
+    :param A: Average periodic rates at the early payment day, broadcast together with R and n.
+    :param B: The shared future periodic payments.
+    :param C: The average periodic rate when the loan was taken.
+    :param R: The periodic rates applying to the loan at the early payment day.
+    :param n: Periods from the early payment day until the rate-change day.
+    :return: The early payment fee per scenario, as an int64 array.
+    """
+    B = np.asarray(B, dtype=np.float64)
+    num_payments = len(B)
+    A, R, n = np.broadcast_arrays(np.atleast_1d(A), R, n)
+    n = np.where((n < 0) | (n > num_payments), num_payments, n).astype(np.intp)
+    C_effective = np.minimum(C, R)
+
+    # One discounted prefix-sum table per distinct monthly rate; head NPVs are
+    # prefix reads and tail NPVs are suffix reads shifted forward n periods.
+    periods = np.arange(1, num_payments + 1, dtype=np.float64)
+    prefix_sums = {}
+    for rate in np.unique(np.concatenate((A, C_effective, R))):
+        monthly_rate = rate / 12
+        discounted = B * (1 + monthly_rate) ** -periods
+        prefix_sums[rate] = np.concatenate(([0.0], np.cumsum(discounted)))
+
+    fees = np.empty(A.shape)
+    for i in np.ndindex(A.shape):
+        a, c, r, months = A[i], C_effective[i], R[i], n[i]
+        tail_npv = (prefix_sums[r][num_payments] - prefix_sums[r][months]) * (1 + r / 12) ** float(months)
+        aa_bb = prefix_sums[a][months] + (1 + a / 12) ** float(-months) * tail_npv
+        cc_dd = prefix_sums[c][months] + (1 + c / 12) ** float(-months) * tail_npv
+        fees[i] = aa_bb - cc_dd
+    return np.rint(fees).astype(np.int64)
+
+
+@njit(cache=True)
+def _irr_newton(cash_flows: np.ndarray, guess: float) -> float:
+    """
+    Newton iteration for the periodic IRR of a cash-flow array.
+
+    NPV and its derivative are evaluated in Horner form in the discount factor
+    1 / (1 + rate).
+
+    :param cash_flows: The periodic cash flows as a float64 array.
+    :param guess: Initial guess for the periodic rate.
+
+    :return: The converged rate, or NaN if the iteration fails.
+    """
+    rate = guess
+    for _ in range(50):
+        if rate <= -1.0 or not np.isfinite(rate):
+            return np.nan
+        discount = 1.0 / (1.0 + rate)
+        npv = 0.0
+        npv_derivative_in_discount = 0.0
+        for index in range(len(cash_flows) - 1, -1, -1):
+            npv_derivative_in_discount = npv_derivative_in_discount * discount + npv
+            npv = npv * discount + cash_flows[index]
+        npv_derivative = npv_derivative_in_discount * (-discount * discount)
+        if npv_derivative == 0.0:
+            return np.nan
+        step = npv / npv_derivative
+        rate -= step
+        if abs(step) < 1e-9:
+            return rate
+    return np.nan
+
+
+def internal_rate_of_return(cash_flows: Union[List[float], np.ndarray], guess: float = 0.1) -> float:
+    """
+    Calculate the Internal Rate of Return (IRR) of a series of cash flows.
+
+    Uses Newton's method, which is far cheaper than the polynomial-root approach of
+    numpy_financial.irr, and falls back to the latter when the iteration does not converge.
+
+    :param cash_flows: The periodic cash flows, starting with the (negative) investment.
+    :param guess: Initial guess for the periodic rate.
+
+    :return: The IRR as a fraction per period.
+    """
+    cash_flow_arr = np.asarray(cash_flows, dtype=np.float64)
+    rate = _irr_newton(cash_flow_arr, guess)
+    if np.isnan(rate):
+        rate = npf.irr(cash_flow_arr)
+    return rate
+
+
+# Discount-factor ladders as (thresholds, factors) tables; months below the
+# first threshold get no discount (factor 1.0).
+_ELIGIBILITY_THRESHOLDS = np.array([12, 24, 36, 48])
+_ELIGIBILITY_FACTORS = np.array([0.9, 0.8, 0.7, 0.6])
+_NO_ELIGIBILITY_THRESHOLDS = np.array([36, 60])
+_NO_ELIGIBILITY_FACTORS = np.array([0.8, 0.7])
 
 
 def calculate_discount_factor(num_of_months: int, eligibility_present: bool) -> float:
@@ -37,20 +149,28 @@ def calculate_discount_factor(num_of_months: int, eligibility_present: bool) ->
     :return:
     """
     if eligibility_present:
-        if num_of_months >= 48:
-            return 0.6
-        elif num_of_months >= 36:
-            return 0.7
-        elif num_of_months >= 24:
-            return 0.8
-        elif num_of_months >= 12:
-            return 0.9
+        thresholds, factors = _ELIGIBILITY_THRESHOLDS, _ELIGIBILITY_FACTORS
+    else:
+        thresholds, factors = _NO_ELIGIBILITY_THRESHOLDS, _NO_ELIGIBILITY_FACTORS
+    index = np.searchsorted(thresholds, num_of_months, side='right') - 1
+    return 1.0 if index < 0 else float(factors[index])
+
+
+def calculate_discount_factors(months: np.ndarray, eligibility_present: bool) -> np.ndarray:
+    """
+    Vectorized companion of :func:`calculate_discount_factor` for scoring many
+    exit months in one call.
+
+    :param months: Months-from-loan-start values, as an integer array.
+    :param eligibility_present: Whether the mortgage includes an Eligibility track.
+    :return: The discount factor per month, as a float64 array.
+    """
+    if eligibility_present:
+        thresholds, factors = _ELIGIBILITY_THRESHOLDS, _ELIGIBILITY_FACTORS
     else:
-        if num_of_months >= 60:
-            return 0.7
-        elif num_of_months >= 36:
-            return 0.8
-    return 1.0
+        thresholds, factors = _NO_ELIGIBILITY_THRESHOLDS, _NO_ELIGIBILITY_FACTORS
+    indexes = np.searchsorted(thresholds, months, side='right') - 1
+    return np.where(indexes < 0, 1.0, factors[indexes])
 
 
 def calculate_maximum_loan_amount(num_payments: int, monthly_payment: int) -> int:
@@ -0,0 +1,118 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is an optional speedup: without it the kernels run as regular Python
+    # and produce the exact same results.
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
+
+@njit(cache=True, nogil=True)
+def amortize_track(initial_loan_amount: float,
+                   interest_rate: float,
+                   num_payments: int,
+                   interest_only_period: int,
+                   linked_index: np.ndarray,
+                   forecasting_interest_rate: np.ndarray):
+    """
+    Compute the full amortization schedule of a single mortgage track.
+
+    This is the hot loop behind every schedule accessor, extracted to a module-level
+    kernel so Numba can JIT-compile it when installed. The payment formula follows the
+    original loop (and numpy_financial's ``pmt``) exactly. Only the balance is rounded
+    per period, because the rounded balance feeds back into the next period; the
+    principal and interest arrays come back unrounded and the caller rounds them in
+    one vectorized pass.
+
+    :param initial_loan_amount: The initial loan amount.
+    :param interest_rate: The annual interest rate.
+    :param num_payments: The total number of monthly payments.
+    :param interest_only_period: Number of leading months in which only interest is paid.
+    :param linked_index: Monthly linked-index changes, as a float64 array.
+    :param forecasting_interest_rate: Monthly interest-rate changes, as a float64 array.
+    :return: A tuple of (unrounded principal payments, unrounded interest payments,
+        rounded remaining balances, total principal paid, total interest paid).
+    """
+    principal_payments = np.empty(num_payments)
+    interest_payments = np.empty(num_payments)
+    remaining_balances = np.empty(num_payments)
+    total_principal_paid, total_interest_paid = 0.0, 0.0
+
+    # Initial values for the first period
+    remaining_balance = initial_loan_amount
+
+    # Monthly interest rate
+    monthly_interest = interest_rate / 12
+
+    # Interest-only head: the balance never changes, so every period pays the
+    # same rounded interest and the arrays are filled with broadcast stores.
+    if interest_only_period > 0:
+        interest_payment = round(remaining_balance * monthly_interest, 2)
+        principal_payments[:interest_only_period] = 0.0
+        interest_payments[:interest_only_period] = interest_payment
+        remaining_balances[:interest_only_period] = remaining_balance
+        # Accumulated term by term to stay bit-identical with the old loop.
+        for _ in range(interest_only_period):
+            total_interest_paid += interest_payment
+
+    # Calculate principal and interest payments for the remaining term
+    amortized_payments = num_payments - interest_only_period
+
+    # With no forecast rate changes the monthly rate is constant, so the
+    # annuity growth factors (1+r)**k can be tabulated once instead of one
+    # pow call per period; the table holds the exact same pow results.
+    rate_is_static = True
+    for k in range(amortized_payments):
+        if forecasting_interest_rate[k] != 0.0:
+            rate_is_static = False
+            break
+    growth_powers = np.empty(0)
+    if rate_is_static:
+        # Built with scalar pow so each entry is bit-identical to the value the
+        # recurrence used to compute inline; np.power's vectorized pow differs
+        # in the last ulp and would perturb the rounded balance feedback.
+        growth_powers = np.empty(amortized_payments + 1)
+        growth_base = 1 + monthly_interest
+        for k in range(amortized_payments + 1):
+            growth_powers[k] = growth_base ** float(k)
+
+    for period in range(1, amortized_payments + 1):
+        # Update remaining balance and interest rate based on indices
+        remaining_balance = remaining_balance * (1 + linked_index[period - 1])
+        if not rate_is_static:
+            interest_rate = interest_rate * (1 + forecasting_interest_rate[period - 1])
+
+        # Calculate interest and principal payments for the current period
+        interest_payment = remaining_balance * interest_rate / 12
+        monthly_rate = interest_rate / 12
+        remaining_periods = amortized_payments - (period - 1)
+        # Inlined numpy_financial.pmt for scalars
+        if rate_is_static:
+            growth = growth_powers[remaining_periods]
+        else:
+            growth = (1 + monthly_rate) ** float(remaining_periods)
+        if monthly_rate == 0.0:
+            annuity_factor = float(remaining_periods)
+        else:
+            annuity_factor = (growth - 1) / monthly_rate
+        principal_payment = remaining_balance * growth / annuity_factor - interest_payment
+        remaining_balance -= principal_payment
+
+        # Update total payments
+        total_principal_paid += principal_payment
+        total_interest_paid += interest_payment
+
+        # Only the balance needs rounding here: the next period reads it back.
+        remaining_balance = round(remaining_balance, 2)
+        i = interest_only_period + period - 1
+        principal_payments[i] = principal_payment
+        interest_payments[i] = interest_payment
+        remaining_balances[i] = remaining_balance
+
+    return principal_payments, interest_payments, remaining_balances, total_principal_paid, total_interest_paid
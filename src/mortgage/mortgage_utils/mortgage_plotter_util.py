@@ -1,8 +1,11 @@
-import matplotlib.pyplot as plt
 from typing import List
 
+# matplotlib.pyplot is imported inside each function so that headless batch
+# runs that never plot do not pay for backend initialization at import time.
+
 
 def plot_monthly_payments(max_num_of_payments: int, monthly_payments: List[float]):
+    import matplotlib.pyplot as plt
     x_values = list(range(1, max_num_of_payments + 1))
     plt.plot(x_values, monthly_payments, label='Monthly Payments')
     plt.xlabel('Payment Number')
@@ -12,6 +15,7 @@ def plot_monthly_payments(max_num_of_payments: int, monthly_payments: List[float
     plt.show()
 
 def plot_principal_and_interest_payments(max_num_of_payments: int, principal_payments: List[float], interest_payments: List[float]):
+    import matplotlib.pyplot as plt
     x_values = list(range(1, max_num_of_payments + 1))
     plt.plot(x_values, principal_payments, label='Principal Payments')
     plt.plot(x_values, interest_payments, label='Interest Payments')
@@ -23,9 +27,10 @@ def plot_principal_and_interest_payments(max_num_of_payments: int, principal_pay
 
 
 def plot_remain_balances(remain_balances: List[int]):
+    import matplotlib.pyplot as plt
     plt.plot(remain_balances, label='Remain Balances')
     plt.xlabel('Payment Number (Month)')
     plt.ylabel('Payment Amount (NIS)')
     plt.title('Loan Payments Over Time')
     plt.legend()
-    plt.show()
\ No newline at end of file
+    plt.show()
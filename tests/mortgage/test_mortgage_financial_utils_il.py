@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+import numpy_financial as npf
+
+from src.mortgage.mortgage_utils.mortgage_financial_utils_il import (
+    calculate_discount_factor,
+    calculate_discount_factors,
+    calculate_early_payment_fee,
+    calculate_early_payment_fees,
+    internal_rate_of_return,
+)
+
+
+class TestInternalRateOfReturn(unittest.TestCase):
+
+    def test_matches_npf_irr_on_mortgage_cash_flows(self):
+        # Differential check of the Newton IRR against numpy_financial's
+        # polynomial-root implementation over random annuity cash flows.
+        rng = np.random.default_rng(0)
+        for _ in range(25):
+            num_payments = int(rng.integers(12, 121))
+            annual_rate = float(rng.uniform(0.005, 0.09))
+            loan = float(rng.integers(50_000, 2_000_000))
+            monthly_rate = annual_rate / 12
+            payment = loan * monthly_rate / (1 - (1 + monthly_rate) ** -num_payments)
+            payment *= float(rng.uniform(0.7, 1.3))
+            cash_flows = np.concatenate(([-loan], np.full(num_payments, payment)))
+            self.assertAlmostEqual(npf.irr(cash_flows),
+                                   internal_rate_of_return(cash_flows, monthly_rate),
+                                   places=9)
+
+    def test_matches_npf_irr_on_truncated_exit(self):
+        # An early exit leaves the payments short of the loan, so the IRR is
+        # deeply negative; the iteration must still agree with npf.irr.
+        cash_flows = np.concatenate(([-200_000.0], np.full(60, 1539.0)))
+        self.assertAlmostEqual(npf.irr(cash_flows),
+                               internal_rate_of_return(cash_flows, 0.045 / 12),
+                               places=9)
+
+
+class TestCalculateEarlyPaymentFees(unittest.TestCase):
+
+    def test_batch_agrees_with_scalar(self):
+        # The batched companion must reproduce the scalar fee for every
+        # (A, R, n) scenario, including the out-of-range n fallbacks.
+        rng = np.random.default_rng(1)
+        for _ in range(10):
+            num_payments = int(rng.integers(12, 361))
+            B = rng.uniform(500, 5000, num_payments)
+            C = float(rng.uniform(0.01, 0.07))
+            A = rng.uniform(0.005, 0.08, 20)
+            R = rng.uniform(0.005, 0.08, 20)
+            n = rng.integers(-1, num_payments + 2, 20)
+            batch = calculate_early_payment_fees(A, B, C, R, n)
+            for a, r, months, fee in zip(A, R, n, batch):
+                self.assertEqual(calculate_early_payment_fee(float(a), B, C, float(r), int(months)),
+                                 fee)
+
+    def test_broadcasts_scalars(self):
+        B = np.full(120, 1000.0)
+        batch = calculate_early_payment_fees(0.02, B, 0.04, 0.04, np.array([0, 24, 120]))
+        self.assertEqual((3,), batch.shape)
+        for months, fee in zip((0, 24, 120), batch):
+            self.assertEqual(calculate_early_payment_fee(0.02, B, 0.04, 0.04, months), fee)
+
+
+class TestCalculateDiscountFactors(unittest.TestCase):
+
+    def test_matches_scalar_ladder(self):
+        months = np.arange(0, 120)
+        for eligibility_present in (True, False):
+            expected = [calculate_discount_factor(int(month), eligibility_present)
+                        for month in months]
+            self.assertEqual(expected,
+                             calculate_discount_factors(months, eligibility_present).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()